@@ -0,0 +1 @@
+# Shared cleansing and categorization engine for the TMF Reporter
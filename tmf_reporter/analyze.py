@@ -0,0 +1,298 @@
+import argparse
+import math
+import re
+import sys
+import time
+from collections import namedtuple
+
+try:
+    import re._parser as sre_parse
+    import re._constants as sre_constants
+except ImportError:  # Python < 3.11
+    import sre_parse
+    import sre_constants
+
+from tmf_reporter.normalize import Normalizer
+from tmf_reporter.parser import iter_lines
+from tmf_reporter.rules import ISSUE_PATTERNS, RULES, RulesError, load_rules
+
+LITERAL = sre_constants.LITERAL
+NOT_LITERAL = sre_constants.NOT_LITERAL
+ANY = sre_constants.ANY
+IN = sre_constants.IN
+NEGATE = sre_constants.NEGATE
+BRANCH = sre_constants.BRANCH
+SUBPATTERN = sre_constants.SUBPATTERN
+ASSERTS = (sre_constants.ASSERT, sre_constants.ASSERT_NOT)
+REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT)
+MAXREPEAT = sre_constants.MAXREPEAT
+
+# Static analysis of one top-level alternative of a rule
+BranchStats = namedtuple("BranchStats", ["text", "unbounded", "optional_wildcards", "nested", "score"])
+
+# Full report line for one category rule
+RuleReport = namedtuple("RuleReport", [
+    "name", "score", "branches", "worst_branch", "worst_ms", "growth", "worst_input",
+])
+
+
+# True for a repeat body made only of "." wildcards, e.g. the "." in "(.)?"
+def _is_wildcard(items):
+    items = list(items)
+    if not items:
+        return False
+    for op, av in items:
+        if op is SUBPATTERN:
+            if not _is_wildcard(av[-1]):
+                return False
+        elif op is not ANY:
+            return False
+    return True
+
+
+# True for a repeat body that can swallow almost any text, like "." or "[^\s]"
+def _is_wide(items):
+    items = list(items)
+    if len(items) != 1:
+        return False
+    op, av = items[0]
+    if op is SUBPATTERN:
+        return _is_wide(av[-1])
+    return op is ANY or op is NOT_LITERAL or (op is IN and av and av[0][0] is NEGATE)
+
+
+# Count the backtracking-prone constructs in a parsed sequence
+def _walk(items, counts, in_unbounded=False):
+    for op, av in items:
+        if op in REPEATS:
+            low, high, body = av
+            unbounded = high == MAXREPEAT
+            if unbounded:
+                if _is_wide(body):
+                    counts["unbounded"] += 1
+                if in_unbounded:
+                    counts["nested"] += 1
+            if low == 0 and high == 1 and _is_wildcard(body):
+                counts["optional_wildcards"] += 1
+            _walk(body, counts, in_unbounded or unbounded)
+        elif op is SUBPATTERN:
+            _walk(av[-1], counts, in_unbounded)
+        elif op is BRANCH:
+            # Only one alternative is taken, so count the worst one
+            worst = {}
+            for alternative in av[1]:
+                sub_counts = dict.fromkeys(counts, 0)
+                _walk(alternative, sub_counts, in_unbounded)
+                for key, value in sub_counts.items():
+                    worst[key] = max(worst.get(key, 0), value)
+            for key, value in worst.items():
+                counts[key] += value
+        elif op in ASSERTS:
+            _walk(av[1], counts, in_unbounded)
+
+
+# Score one alternative. Every wide unbounded repeat (".*", "[^\s]+", ...)
+# chained in a sequence adds a polynomial degree to the work of a failed
+# search, an unbounded repeat inside another one can go exponential, and each
+# optional wildcard "(.)?" doubles the ways the engine can line the text up.
+def score_branch(items):
+    counts = {"unbounded": 0, "optional_wildcards": 0, "nested": 0}
+    _walk(items, counts)
+    score = 10 * counts["unbounded"] ** 2 + 3 * counts["optional_wildcards"] + 1000 * counts["nested"]
+    return counts, score
+
+
+# Split a pattern into its top-level alternatives, keeping their source text
+def _split_branches(pattern):
+    branches = []
+    depth = 0
+    in_class = False
+    start = 0
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if in_class:
+            if ch == "]":
+                in_class = False
+        elif ch == "[":
+            in_class = True
+            # A "]" right after "[" or "[^" is a literal
+            if pattern[i + 1:i + 2] == "]":
+                i += 1
+            elif pattern[i + 1:i + 3] == "^]":
+                i += 2
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "|" and depth == 0:
+            branches.append(pattern[start:i])
+            start = i + 1
+        i += 1
+    branches.append(pattern[start:])
+    return branches
+
+
+# Statically analyze every top-level alternative of a pattern
+def analyze_pattern(pattern, flags=re.IGNORECASE):
+    stats = []
+    for text in _split_branches(pattern):
+        counts, score = score_branch(sre_parse.parse(text, flags))
+        stats.append(BranchStats(text, counts["unbounded"], counts["optional_wildcards"], counts["nested"], score))
+    return stats
+
+
+# Collect all literal runs of a parsed pattern, to build near-miss inputs from
+def _literal_runs(items, runs, current):
+    for op, av in items:
+        if op is LITERAL:
+            current.append(chr(av))
+            continue
+        if current:
+            runs.append("".join(current))
+            current.clear()
+        if op in REPEATS:
+            _literal_runs(av[2], runs, current)
+        elif op is SUBPATTERN:
+            _literal_runs(av[-1], runs, current)
+        elif op is BRANCH:
+            for alternative in av[1]:
+                _literal_runs(alternative, runs, current)
+                if current:
+                    runs.append("".join(current))
+                    current.clear()
+    return runs
+
+
+# Build inputs of the given length that make a rule work hard: its own
+# literal fragments run together (near misses for the ".*" chains), the same
+# fragments with letters spread apart, and plain filler text
+def adversarial_inputs(pattern, length):
+    current = []
+    runs = _literal_runs(sre_parse.parse(pattern, re.IGNORECASE), [], current)
+    if current:
+        runs.append("".join(current))
+    fragments = " ".join(run.strip() for run in runs if run.strip()) or "a"
+    spread = " ".join(fragments)
+
+    def fill(text):
+        return (text + " ") * (length // (len(text) + 1) + 1)
+
+    return {
+        "near-miss": fill(fragments)[:length],
+        "spread": fill(spread)[:length],
+        "filler": fill("mohon bantuan semak order")[:length],
+    }
+
+
+# Return the longest lines of the given text files, as real long messages
+def long_messages(paths, count=5):
+    lines = []
+    for path in paths:
+        with open(path, "rb") as file:
+            lines.extend(line.strip() for line in iter_lines(file))
+    return sorted(lines, key=len, reverse=True)[:count]
+
+
+def _time_search(regex, text, repeat=3):
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        regex.search(text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+# Time a rule on adversarial inputs at half and full length and on real long
+# messages. Returns the worst time in ms, the input it happened on, and the
+# growth exponent measured between the two lengths (1 is linear).
+def time_rule(pattern, length, real_inputs=(), flags=re.IGNORECASE):
+    regex = re.compile(pattern, flags)
+    worst_ms, worst_input, growth = 0.0, "", 0.0
+
+    half = adversarial_inputs(pattern, length // 2)
+    for label, text in adversarial_inputs(pattern, length).items():
+        full_ms = _time_search(regex, text)
+        half_ms = _time_search(regex, half[label])
+        if half_ms > 0.001:
+            growth = max(growth, math.log2(full_ms / half_ms))
+        if full_ms > worst_ms:
+            worst_ms, worst_input = full_ms, label
+
+    for i, text in enumerate(real_inputs):
+        ms = _time_search(regex, text, repeat=1)
+        if ms > worst_ms:
+            worst_ms, worst_input = ms, f"real #{i + 1}"
+
+    return worst_ms, worst_input, growth
+
+
+# Analyze and time every rule, worst first. Real inputs are timed as given, so
+# normalize them first for rules that run on normalized text.
+def analyze_rules(issue_patterns=ISSUE_PATTERNS, length=2000, real_inputs=(), timing=True, flags=re.IGNORECASE):
+    reports = []
+    for name, pattern in issue_patterns.items():
+        branches = analyze_pattern(pattern, flags)
+        worst_branch = max(branches, key=lambda b: b.score)
+        worst_ms, worst_input, growth = time_rule(pattern, length, real_inputs, flags) if timing else (0.0, "", 0.0)
+        reports.append(RuleReport(name, worst_branch.score, len(branches), worst_branch, worst_ms, growth, worst_input))
+    reports.sort(key=lambda r: (r.worst_ms, r.score), reverse=True)
+    return reports
+
+
+def _shorten(text, width):
+    return text if len(text) <= width else text[:width - 3] + "..."
+
+
+def print_report(reports, max_score, max_ms, file=sys.stdout):
+    print(f"{'#':>3}  {'ms':>8}  {'growth':>6}  {'score':>5}  {'.*':>3}  {'(.)?':>4}  {'nest':>4}  category / worst branch",
+          file=file)
+    for rank, report in enumerate(reports, 1):
+        branch = report.worst_branch
+        flag = " !" if report.score > max_score or report.worst_ms > max_ms else ""
+        print(f"{rank:>3}  {report.worst_ms:>8.2f}  {report.growth:>6.2f}  {report.score:>5}  {branch.unbounded:>3}  "
+              f"{branch.optional_wildcards:>4}  {branch.nested:>4}  {report.name}{flag}", file=file)
+        print(f"{'':>48}{_shorten(branch.text, 70)}  [{report.worst_input}]", file=file)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m tmf_reporter.analyze",
+        description="Rank the category rules by backtracking risk and measured match time.",
+    )
+    parser.add_argument("--rules", help="rules file to check instead of the one in use (it is validated first)")
+    parser.add_argument("--input", nargs="*", default=[], help="text exports whose longest lines are timed as real inputs")
+    parser.add_argument("--length", type=int, default=2000, help="length of the adversarial inputs (default: 2000)")
+    parser.add_argument("--max-score", type=int, default=400, help="fail when a rule's static score exceeds this (default: 400)")
+    parser.add_argument("--max-ms", type=float, default=5000.0, help="fail when a rule takes longer than this on one input (default: 5000)")
+    parser.add_argument("--static-only", action="store_true", help="skip timing and only score the patterns")
+    args = parser.parse_args(argv)
+
+    rules = RULES
+    if args.rules:
+        try:
+            rules = load_rules(args.rules)
+        except (OSError, RulesError) as error:
+            print(error, file=sys.stderr)
+            return 2
+
+    real_inputs = long_messages(args.input)
+    if rules.normalize is not None:
+        normalize = Normalizer(rules.normalize)
+        real_inputs = [normalize(text) for text in real_inputs]
+    reports = analyze_rules(rules.issue_patterns, length=args.length, real_inputs=real_inputs,
+                            timing=not args.static_only, flags=rules.flags)
+    print_report(reports, args.max_score, args.max_ms)
+
+    failed = [r for r in reports if r.score > args.max_score or r.worst_ms > args.max_ms]
+    if failed:
+        print(f"\n{len(failed)} rule(s) over the threshold: {', '.join(r.name for r in failed)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+import argparse
+import glob
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from tmf_reporter.cache import content_hash
+from tmf_reporter.cleansing import DEFAULT_BASE_NAMES, iter_filtered_messages, split_base_names
+from tmf_reporter.engine import ENGINE
+from tmf_reporter.guard import guarded, slow_rule_report
+from tmf_reporter.history import HistoryStore, run_key
+from tmf_reporter.message import parse_messages, parse_pieces
+from tmf_reporter.parallel import categorize
+from tmf_reporter.report import format_result
+from tmf_reporter.vectorized import default_engine
+
+MODES = ("both", "cleanse", "categorize")
+
+CLEANED_FOLDER = "cleaned"
+REPORT_NAME = "categorized_output.txt"
+
+
+# Expand the command-line inputs (files, folders and glob patterns) into a sorted,
+# de-duplicated list of export files. Folders contribute the *.txt files directly in
+# them, except a report written there by an earlier run.
+def find_inputs(inputs, pattern="*.txt"):
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            matches = [path for path in glob.glob(os.path.join(item, pattern)) if os.path.basename(path) != REPORT_NAME]
+        elif any(char in item for char in "*?["):
+            matches = glob.glob(item, recursive=True)
+        else:
+            matches = [item] if os.path.isfile(item) else []
+        paths.extend(sorted(path for path in matches if os.path.isfile(path)))
+
+    unique = []
+    seen = set()
+    for path in paths:
+        key = os.path.normcase(os.path.abspath(path))
+        if key not in seen:
+            seen.add(key)
+            unique.append(path)
+    return unique
+
+
+# Give each input a distinct output file name, "name (2).txt" for repeats from other folders
+def output_names(paths):
+    names = []
+    taken = set()
+    for path in paths:
+        name = os.path.basename(path)
+        stem, ext = os.path.splitext(name)
+        count = 1
+        while name.lower() in taken:
+            count += 1
+            name = f"{stem} ({count}){ext}"
+        taken.add(name.lower())
+        names.append(name)
+    return names
+
+
+def _counted(items, counts):
+    for item in items:
+        counts[0] += 1
+        yield item
+
+
+# Yield the cleansed text of one export piece by piece, laid out like the cleaning script's files
+def _cleansed_pieces(source, base_names, match_anywhere, counts):
+    for message in iter_filtered_messages(source, base_names, match_anywhere):
+        if counts[0]:
+            yield "\n\n"
+        counts[0] += 1
+        yield message
+
+
+def _write_through(pieces, output):
+    for piece in pieces:
+        output.write(piece)
+        yield piece
+
+
+# Process one export in a worker process. "cleanse" writes its cleansed text to
+# cleansed_path, "categorize" categorizes it as it is and "both" categorizes the
+# cleansed text while writing it. With budget, categorization runs under that many
+# seconds per message (see guard.GuardedMatcher). vectorized categorizes with the
+# vectorized.VectorizedEngine. Returns (result or None, messages, seconds, timeouts,
+# (memo hits, memo lookups)), where messages counts the messages kept by cleansing, or
+# the blocks categorized, and the memo counts are those of this file.
+def process_file(path, mode, cleansed_path, base_names, match_anywhere=False, budget=None, vectorized=False):
+    start = time.perf_counter()
+    counts = [0]
+    result = None
+    name = os.path.basename(path)
+    engine = default_engine() if vectorized else ENGINE
+    memo_before = engine.memo.stats() if engine.memo is not None else (0, 0)
+
+    with open(path, "rb") as source, guarded(engine, budget) as guard:
+        if mode == "categorize":
+            result = categorize(_counted(parse_messages(source, file_name=name), counts), engine.new_result(),
+                                engine=engine, guard=guard)
+        else:
+            with open(cleansed_path, "w", encoding="utf-8", newline="") as cleansed:
+                pieces = _write_through(_cleansed_pieces(source, base_names, match_anywhere, counts), cleansed)
+                if mode == "both":
+                    result = categorize(parse_pieces(pieces, name), engine.new_result(), engine=engine, guard=guard)
+                else:
+                    for _ in pieces:
+                        pass
+
+    if result is not None:
+        # The report text is all the parent needs of the Message records
+        result.messages = [str(message) for message in result.messages]
+    memo_after = engine.memo.stats() if engine.memo is not None else (0, 0)
+    memo = (memo_after[0] - memo_before[0], memo_after[1] - memo_before[1])
+    return result, counts[0], time.perf_counter() - start, guard.timeouts if guard is not None else [], memo
+
+
+# Process the exports over a pool of worker processes, one file per task, and write
+# the cleansed files and the combined report into output_dir. Files are reported
+# and merged in input order, each with its own ticket/ID de-duplication, the same
+# as uploading them together to the app. Returns (per-file stats in input order, or
+# None for a file that failed, and the list of failed paths). Stats include the
+# messages that went over budget, if one is set. With a history.HistoryStore, the
+# report's tickets/IDs are recorded in it, once for the same files and settings.
+def run_batch(paths, output_dir, mode="both", base_names=None, match_anywhere=False, workers=None, log=print,
+              budget=None, history=None, vectorized=False):
+    base_names = split_base_names(DEFAULT_BASE_NAMES) if base_names is None else base_names
+    workers = min(workers or os.cpu_count() or 1, len(paths)) or 1
+    cleaned_dir = os.path.join(output_dir, CLEANED_FOLDER)
+    os.makedirs(cleaned_dir if mode != "categorize" else output_dir, exist_ok=True)
+
+    stats = [None] * len(paths)
+    results = [None] * len(paths)
+    failed = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        futures = {
+            executor.submit(process_file, path, mode, os.path.join(cleaned_dir, name), base_names, match_anywhere,
+                            budget, vectorized): i
+            for i, (path, name) in enumerate(zip(paths, output_names(paths)))
+        }
+        for future in as_completed(futures):
+            i = futures[future]
+            path = paths[i]
+            try:
+                results[i], messages, seconds, timeouts, memo = future.result()
+            except Exception as error:
+                failed.append(path)
+                log(f"Failed: {path}: {error}")
+                continue
+            stats[i] = {"path": path, "bytes": os.path.getsize(path), "messages": messages, "seconds": seconds,
+                        "timeouts": timeouts, "memo_hits": memo[0], "memo_lookups": memo[1]}
+            log(f"Done: {path} ({messages} messages, {seconds:.2f}s)")
+
+    if mode != "cleanse":
+        combined = ENGINE.new_result()
+        for result in results:
+            if result is not None:
+                combined.extend(result)
+        with open(os.path.join(output_dir, REPORT_NAME), "w", encoding="utf-8") as report:
+            report.write(format_result(combined))
+        if history is not None:
+            files = []
+            for path in [row["path"] for row in stats if row is not None]:
+                with open(path, "rb") as source:
+                    files.append((os.path.basename(path), content_hash(source)))
+            key = run_key("batch", mode, files, tuple(base_names), match_anywhere, ENGINE.version, budget)
+            history.record_run(combined, f"batch ({mode})", [name for name, _ in files], ENGINE.version, key)
+    return stats, failed
+
+
+def print_summary(stats, wall_seconds, workers, file=sys.stdout):
+    done = [row for row in stats if row is not None]
+    print(f"\n{'file':<40} {'MB':>8} {'messages':>9} {'seconds':>8} {'MB/s':>7}", file=file)
+    for row in done:
+        mb = row["bytes"] / (1 << 20)
+        rate = mb / row["seconds"] if row["seconds"] else 0.0
+        name = os.path.basename(row["path"])
+        print(f"{name[:40]:<40} {mb:>8.2f} {row['messages']:>9} {row['seconds']:>8.2f} {rate:>7.2f}", file=file)
+    total_mb = sum(row["bytes"] for row in done) / (1 << 20)
+    total_messages = sum(row["messages"] for row in done)
+    rate = total_mb / wall_seconds if wall_seconds else 0.0
+    print(f"\n{len(done)} files, {total_mb:.2f} MB, {total_messages} messages in {wall_seconds:.2f}s "
+          f"({rate:.2f} MB/s) with {workers} worker process(es)", file=file)
+    memo_lookups = sum(row["memo_lookups"] for row in done)
+    if memo_lookups:
+        memo_hits = sum(row["memo_hits"] for row in done)
+        print(f"{memo_hits} of {memo_lookups} messages ({memo_hits / memo_lookups:.1%}) had the shape of an "
+              f"earlier message and reused its rule decision", file=file)
+
+    timeouts = [timeout for row in done for timeout in row["timeouts"]]
+    if timeouts:
+        print(f"\n{len(timeouts)} message(s) went over the time budget and were quarantined. Slow rules:", file=file)
+        for row in slow_rule_report(timeouts):
+            print(f"  {row['Rule']:<40} {row['Messages']:>6} messages, longest {row['Longest message (chars)']} chars",
+                  file=file)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m tmf_reporter.batch",
+        description="Cleanse and categorize WhatsApp exports without the app, over several processes.",
+    )
+    parser.add_argument("inputs", nargs="+", help="export files, folders (their *.txt files) or glob patterns")
+    parser.add_argument("-o", "--output", required=True, help="folder for the cleaned files and the report")
+    parser.add_argument("--mode", choices=MODES, default="both",
+                        help="cleanse, categorize as is (already cleansed exports), or both (default)")
+    parser.add_argument("--names", default=DEFAULT_BASE_NAMES, help="comma-separated names to remove when cleansing")
+    parser.add_argument("--match-anywhere", action="store_true", help="also remove messages that mention one of the names")
+    parser.add_argument("-j", "--workers", type=int, default=0, help="worker processes (default: all CPU cores)")
+    parser.add_argument("--budget", type=float, metavar="SECONDS",
+                        help="time budget per message; slower messages are quarantined instead of stalling the run")
+    parser.add_argument("--vectorized", action="store_true",
+                        help="run each category rule over all messages of a file at once (needs pyarrow)")
+    parser.add_argument("--no-history", action="store_true",
+                        help="do not record the report's tickets/IDs in the local history (see tmf_reporter.history)")
+    args = parser.parse_args(argv)
+
+    paths = find_inputs(args.inputs)
+    if not paths:
+        parser.error("no input files found")
+
+    workers = min(args.workers or os.cpu_count() or 1, len(paths))
+    start = time.perf_counter()
+    history = None if args.no_history or args.mode == "cleanse" else HistoryStore()
+    stats, failed = run_batch(paths, args.output, args.mode, split_base_names(args.names), args.match_anywhere, workers,
+                              budget=args.budget, history=history, vectorized=args.vectorized)
+    if history is not None:
+        history.close()
+    print_summary(stats, time.perf_counter() - start, workers)
+
+    if args.mode != "cleanse":
+        print(f"Report written to {os.path.join(args.output, REPORT_NAME)}")
+    if failed:
+        print(f"{len(failed)} file(s) failed", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
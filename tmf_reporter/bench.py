@@ -0,0 +1,250 @@
+import argparse
+import datetime
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from tmf_reporter.cleansing import DEFAULT_BASE_NAMES, filter_messages, split_base_names
+from tmf_reporter.engine import ENGINE
+from tmf_reporter.incremental import default_data_dir
+from tmf_reporter.message import parse_messages
+from tmf_reporter.parallel import categorize
+from tmf_reporter.parser import iter_lines
+from tmf_reporter.report import format_result
+from tmf_reporter.synthetic import GENERATOR_VERSION, MB, cached_export
+from tmf_reporter.vectorized import default_engine
+
+STAGES = ("cleanse", "categorize", "vectorized")
+
+# Bumped when the layout of the saved results changes
+RESULTS_VERSION = 1
+
+
+# Peak resident memory of this process so far in MB, or None where it cannot be read
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / MB if sys.platform == "darwin" else peak / 1024
+
+
+# Time each step of the categorization of one pass over the export: splitting into
+# messages, the ticket/ID scans, normalizing the text, the literal prefilter and every
+# rule's regex.
+# Returns (step seconds, per-category rows of evals, hits and seconds).
+def categorize_breakdown(path, engine=ENGINE):
+    clock = time.perf_counter
+    rules = engine.rules
+    evals = [0] * len(rules)
+    hits = [0] * len(rules)
+    seconds = [0.0] * len(rules)
+    steps = {"split": 0.0, "tickets/IDs": 0.0, "normalize": 0.0, "prefilter": 0.0}
+
+    with open(path, "rb") as file:
+        messages = parse_messages(file)
+        while True:
+            start = clock()
+            message = next(messages, None)
+            steps["split"] += clock() - start
+            if message is None:
+                break
+            text = message.text
+
+            start = clock()
+            engine.find_tokens(text)
+            steps["tickets/IDs"] += clock() - start
+
+            start = clock()
+            text = engine.rule_text(text)
+            steps["normalize"] += clock() - start
+
+            start = clock()
+            candidates = engine.candidates(text)
+            steps["prefilter"] += clock() - start
+
+            while candidates:
+                lowest = candidates & -candidates
+                index = lowest.bit_length() - 1
+                start = clock()
+                matched = rules[index].regex.search(text)
+                seconds[index] += clock() - start
+                evals[index] += 1
+                if matched:
+                    hits[index] += 1
+                    break
+                candidates ^= lowest
+
+    categories = [
+        {"category": rule.name, "evals": evals[i], "hits": hits[i], "seconds": seconds[i]}
+        for i, rule in enumerate(rules)
+    ]
+    categories.sort(key=lambda row: row["seconds"], reverse=True)
+    return steps, categories
+
+
+# Time the steps of cleansing: reading the export into lines, and the name filter
+# with the lowercasing and joining of the kept messages
+def cleanse_breakdown(path, base_names, total_seconds):
+    start = time.perf_counter()
+    with open(path, "rb") as file:
+        for _ in iter_lines(file):
+            pass
+    read = time.perf_counter() - start
+    return {"read lines": read, "filter and join": max(total_seconds - read, 0.0)}
+
+
+# Run one stage on one export and measure it. Called in a fresh process per stage,
+# so the peak RSS belongs to that stage alone.
+def run_stage(stage, path, messages, size_bytes, base_names, workers=1, breakdown=True):
+    base_rss = peak_rss_mb()
+    start = time.perf_counter()
+    with open(path, "rb") as file:
+        if stage == "cleanse":
+            output = filter_messages(file, base_names)
+        else:
+            engine = default_engine() if stage == "vectorized" else ENGINE
+            output = format_result(categorize(parse_messages(file), engine.new_result(), engine=engine, workers=workers))
+    seconds = time.perf_counter() - start
+    peak_rss = peak_rss_mb()
+    del output
+
+    run = {
+        "stage": stage,
+        "size_mb": round(size_bytes / MB, 2),
+        "messages": messages,
+        "seconds": seconds,
+        "messages_per_s": messages / seconds if seconds else None,
+        "mb_per_s": size_bytes / MB / seconds if seconds else None,
+        "base_rss_mb": base_rss,
+        "peak_rss_mb": peak_rss,
+        "workers": workers,
+    }
+    if breakdown:
+        if stage == "cleanse":
+            run["steps"] = cleanse_breakdown(path, base_names, seconds)
+        elif stage == "categorize":
+            run["steps"], run["categories"] = categorize_breakdown(path)
+    return run
+
+
+def _run_isolated(*args):
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return executor.submit(run_stage, *args).result()
+
+
+# Run every stage on a synthetic export of each size. Returns the results document.
+def run_benchmarks(sizes, stages=STAGES, seed=0, data_dir=None, base_names=None, workers=1, breakdown=True,
+                   isolate=True, log=print):
+    data_dir = data_dir or os.path.join(default_data_dir(), "bench")
+    base_names = split_base_names(DEFAULT_BASE_NAMES) if base_names is None else base_names
+    runs = []
+    for size_mb in sizes:
+        log(f"Preparing {size_mb:g} MB export...")
+        path, manifest = cached_export(data_dir, size_mb, seed)
+        for stage in stages:
+            log(f"  {stage}...")
+            args = (stage, path, manifest["messages"], manifest["bytes"], base_names, workers, breakdown)
+            runs.append(_run_isolated(*args) if isolate else run_stage(*args))
+    return {
+        "version": RESULTS_VERSION,
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "ruleset": ENGINE.version,
+        "generator_version": GENERATOR_VERSION,
+        "seed": seed,
+        "runs": runs,
+    }
+
+
+def _format_mb(value):
+    return f"{value:.1f}" if value is not None else "n/a"
+
+
+def print_results(results, top=10, file=sys.stdout):
+    print(f"{'stage':<11} {'MB':>7} {'messages':>10} {'seconds':>8} {'msgs/s':>10} {'MB/s':>7} {'peak RSS MB':>11}", file=file)
+    for run in results["runs"]:
+        print(f"{run['stage']:<11} {run['size_mb']:>7.1f} {run['messages']:>10} {run['seconds']:>8.2f} "
+              f"{run['messages_per_s']:>10.0f} {run['mb_per_s']:>7.2f} {_format_mb(run['peak_rss_mb']):>11}", file=file)
+
+    for run in results["runs"]:
+        if "steps" not in run:
+            continue
+        print(f"\n{run['stage']} {run['size_mb']:.1f} MB", file=file)
+        for step, seconds in run["steps"].items():
+            print(f"  {step:<40} {seconds:>8.3f}s", file=file)
+        for row in run.get("categories", [])[:top]:
+            print(f"  {row['category']:<40} {row['seconds']:>8.3f}s  {row['evals']:>9} evals  {row['hits']:>8} hits",
+                  file=file)
+
+
+# Compare results with a saved baseline, run by run. Returns the runs whose
+# message rate dropped by more than tolerance (a fraction, 0.1 is 10%).
+def compare_results(results, baseline, tolerance=0.1, file=sys.stdout):
+    previous = {(run["stage"], run["size_mb"], run["workers"]): run for run in baseline["runs"]}
+    regressions = []
+    print(f"\nAgainst baseline of {baseline['created']} (rule set {baseline['ruleset']}):", file=file)
+    if (baseline.get("generator_version"), baseline.get("seed")) != (results["generator_version"], results["seed"]):
+        print("  (the baseline was measured on different synthetic exports)", file=file)
+    for run in results["runs"]:
+        old = previous.get((run["stage"], run["size_mb"], run["workers"]))
+        if old is None:
+            continue
+        change = run["messages_per_s"] / old["messages_per_s"] - 1
+        flag = ""
+        if change < -tolerance:
+            flag = "  REGRESSION"
+            regressions.append(run)
+        print(f"  {run['stage']:<11} {run['size_mb']:>7.1f} MB  {old['messages_per_s']:>10.0f} -> "
+              f"{run['messages_per_s']:>10.0f} msgs/s  {change:+.1%}{flag}", file=file)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m tmf_reporter.bench",
+        description="Benchmark cleansing and categorization on synthetic exports.",
+    )
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1, 10], help="export sizes in MB, 1 to 500 (default: 1 10)")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES), help="stages to run (default: all)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the synthetic exports (default: 0)")
+    parser.add_argument("--workers", type=int, default=1, help="categorization worker processes, 0 for all cores (default: 1)")
+    parser.add_argument("--data-dir", help="where generated exports are kept (default: ~/.tmf_reporter/bench)")
+    parser.add_argument("--save", metavar="FILE", help="write the results as JSON, to use as a baseline later")
+    parser.add_argument("--baseline", metavar="FILE", help="compare with results saved by an earlier --save")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="allowed drop in messages/s against the baseline (default: 0.1)")
+    parser.add_argument("--no-breakdown", action="store_true", help="skip the per-step and per-category timing pass")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        args.sizes, args.stages, seed=args.seed, data_dir=args.data_dir, workers=args.workers or None,
+        breakdown=not args.no_breakdown,
+    )
+    print_results(results)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+        print(f"\nSaved results to {args.save}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        if compare_results(results, baseline, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
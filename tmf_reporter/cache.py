@@ -0,0 +1,18 @@
+import hashlib
+
+HASH_CHUNK_SIZE = 1 << 20
+
+
+# Function to hash the contents of an upload or binary file without reading it whole
+def content_hash(source):
+    digest = hashlib.sha256()
+    source.seek(0)
+    for chunk in iter(lambda: source.read(HASH_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    source.seek(0)
+    return digest.hexdigest()
+
+
+# Function to build a hashable cache key for a list of uploads: (file name, content hash) pairs
+def files_key(uploaded_files):
+    return tuple((uploaded_file.name, content_hash(uploaded_file)) for uploaded_file in uploaded_files)
@@ -0,0 +1,122 @@
+import re
+from functools import lru_cache
+
+from tmf_reporter.parser import iter_lines, timestamp_regex
+
+word_regex = re.compile(r'\w+')
+
+# Names removed when cleansing, as entered in the app: the team's own replies and the "] :" notices
+DEFAULT_BASE_NAMES = "Hartina, Tina, Normah, Pom, Afizan, Pijan, Ariff, Arep, Arip, Dheffirdaus, Dhef, Dheff, Dheft, Hazrina, Rina, Nurul, Huda, Zazarida, Zaza, Eliasaph, Wan, ] : , ] :"
+
+
+# Function to turn a comma-separated list of names into the base_names list
+def split_base_names(text):
+    return [name.strip() for name in text.split(",")]
+
+
+# Matches the names to remove against the first line of each message, built once per name list.
+# By default only the sender is checked: the text between the timestamp header and the first
+# ":" of the line (the whole rest of the line for "joined"/"left" style notices). Names are
+# compared word by word against a set, so "Wan" matches "Wan Azmi" but not "Wanda", the
+# same as a word-boundary search. Names that do not start with a letter or digit, like "] :",
+# are looked for in the header and sender part of the line, up to the space after the ":".
+# With anywhere set, all names are compiled into one alternation and searched for in the whole
+# line, message text included, which also drops messages that merely mention a name.
+class NameFilter:
+    def __init__(self, base_names, anywhere=False):
+        self.anywhere = anywhere
+        self._regex = None
+        self._names = set()
+        self._markers = []
+        self._longest = 0
+
+        if anywhere:
+            alternatives = [
+                rf'\b{re.escape(name)}\b' if re.match(r'\w+', name)
+                else re.escape(name)  # No word boundary for non-word characters
+                for name in base_names
+            ]
+            if alternatives:
+                self._regex = re.compile('|'.join(alternatives), re.IGNORECASE)
+            return
+
+        for name in base_names:
+            if re.match(r'\w+', name):
+                words = tuple(word_regex.findall(name.lower()))
+                self._names.add(words)
+                self._longest = max(self._longest, len(words))
+            elif name:
+                self._markers.append(name.lower())
+
+    # True if the message starting with this timestamp line was sent by one of the names.
+    # header_end is where the timestamp header ends in the line.
+    def matches(self, line, header_end):
+        if self.anywhere:
+            return self._regex is not None and self._regex.search(line) is not None
+
+        colon = line.find(':', header_end)
+        if colon < 0:
+            sender_end = prefix_end = len(line)
+        else:
+            sender_end, prefix_end = colon, colon + 2
+
+        if self._markers:
+            prefix = line[:prefix_end].lower()
+            if any(marker in prefix for marker in self._markers):
+                return True
+
+        words = word_regex.findall(line[header_end:sender_end].lower())
+        names = self._names
+        for start in range(len(words)):
+            for end in range(start + 1, min(start + self._longest, len(words)) + 1):
+                if tuple(words[start:end]) in names:
+                    return True
+        return False
+
+
+# Return the NameFilter for a list of names, reusing the one built for the same list before
+@lru_cache(maxsize=32)
+def get_name_filter(base_names, anywhere=False):
+    return NameFilter(base_names, anywhere)
+
+
+# Function to yield the messages of an export that were not sent by any of base_names,
+# joined onto one line and lowercased. source can be a string or a (binary) file object.
+# With match_anywhere, also drop messages whose first line mentions one of the names.
+# tick, if given, is called once for every message read, kept or not.
+def iter_filtered_messages(source, base_names, match_anywhere=False, tick=None):
+    name_filter = get_name_filter(tuple(base_names), match_anywhere)
+
+    skip_block = False
+    current_message = []
+
+    for line in iter_lines(source):
+        header = timestamp_regex.match(line)
+        if header:
+            if tick is not None:
+                tick()
+            if current_message:
+                yield ' '.join(current_message).strip().lower()
+                current_message = []
+
+            if name_filter.matches(line, header.end()):
+                skip_block = True
+            else:
+                skip_block = False
+
+        if not skip_block:
+            current_message.append(line.strip().lower())
+
+    if not skip_block and current_message:
+        yield ' '.join(current_message).strip().lower()
+
+
+# Count the messages iter_filtered_messages reads from an export, kept or not: one per
+# tick it makes
+def count_filtered_messages(source):
+    return sum(1 for line in iter_lines(source) if timestamp_regex.match(line))
+
+
+# Function to filter messages based on base names
+def filter_messages(file_contents, base_names, match_anywhere=False, tick=None):
+    return '\n\n'.join(iter_filtered_messages(file_contents, base_names, match_anywhere, tick))
@@ -0,0 +1,195 @@
+import hashlib
+import re
+from collections import namedtuple
+
+from tmf_reporter.memo import MEMO_SIZE, DecisionMemo
+from tmf_reporter.normalize import Normalizer
+from tmf_reporter.prefilter import LiteralMatcher, extract_literals
+from tmf_reporter.results import ID, TICKET, NewRows, ResultTable
+from tmf_reporter.rules import (
+    RULES,
+    ISSUE_PATTERNS,
+    TICKET_ORDER_PATTERN,
+    ID_PATTERN,
+    IDS_ONLY_CATEGORIES,
+    TICKETS_ONLY_CATEGORIES,
+    OTHERS_CATEGORY,
+    QUARANTINE_CATEGORY,
+)
+
+# Short hash identifying a rule set, so cached results can be tied to the rules that produced them
+def ruleset_version(issue_patterns, ticket_order_pattern, id_pattern, ids_only, tickets_only, flags, normalize=None):
+    digest = hashlib.sha256()
+    for part in (list(issue_patterns.items()), ticket_order_pattern, id_pattern, sorted(ids_only), sorted(tickets_only), int(flags)):
+        digest.update(repr(part).encode("utf-8"))
+    if normalize is not None:
+        digest.update(repr(sorted(normalize.items())).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+# Rule index of a message that went over the time budget of guarded matching
+TIMED_OUT = -2
+
+
+# One compiled category rule and what it captures from a matching message
+Rule = namedtuple("Rule", ["name", "regex", "capture_tickets", "capture_ids", "literals"])
+
+
+# Compiled rule set for categorizing messages. Rules are tried in their original
+# order and the first one that matches decides the category of a message.
+# With prefilter on, a rule's regex only runs when one of the literals it
+# needs occurs in the message; rules without such literals always run. With a
+# normalize table (canonical form -> variants), the rules run on the normalized
+# message; tickets and IDs are still found in the message as it is. Decisions are
+# remembered for up to memo_size shapes of message (see memo.DecisionMemo), 0 for none.
+class RuleEngine:
+    def __init__(self, issue_patterns=ISSUE_PATTERNS, ticket_order_pattern=TICKET_ORDER_PATTERN,
+                 id_pattern=ID_PATTERN, ids_only=IDS_ONLY_CATEGORIES, tickets_only=TICKETS_ONLY_CATEGORIES,
+                 flags=RULES.flags, prefilter=True, normalize=RULES.normalize, memo_size=MEMO_SIZE):
+        ignorecase = bool(flags & re.IGNORECASE)
+        self.version = ruleset_version(issue_patterns, ticket_order_pattern, id_pattern, ids_only, tickets_only, flags,
+                                       normalize)
+        self.normalizer = Normalizer(normalize) if normalize is not None else None
+        self.rules = tuple(
+            Rule(
+                name,
+                re.compile(pattern, flags),
+                capture_tickets=name not in ids_only,
+                capture_ids=name not in tickets_only,
+                literals=extract_literals(pattern, ignorecase) if prefilter else None,
+            )
+            for name, pattern in issue_patterns.items()
+        )
+        self.memo = DecisionMemo(self.rules, memo_size) if memo_size else None
+        self.ticket_regex = re.compile(ticket_order_pattern)
+        self.id_regex = re.compile(id_pattern)
+
+        self._ignorecase = ignorecase
+        self._matcher = None
+        self._always_run = 0
+        if prefilter:
+            self._matcher = LiteralMatcher([rule.literals for rule in self.rules])
+            for i, rule in enumerate(self.rules):
+                if rule.literals is None:
+                    self._always_run |= 1 << i
+
+    # Return a bitmask of the rules worth running on the message
+    def candidates(self, message):
+        # Literals are ASCII, so only ASCII text can be ruled out safely
+        if self._matcher is None or not message.isascii():
+            return (1 << len(self.rules)) - 1
+        text = message.lower() if self._ignorecase else message
+        return self._matcher.scan(text) | self._always_run
+
+    # Return the text the rules run on: the message normalized, if the rules ask for it
+    def rule_text(self, message):
+        return self.normalizer(message) if self.normalizer is not None else message
+
+    # Return the index of the first rule matching the message, or -1
+    def match_index(self, message):
+        message = self.rule_text(message)
+        candidates = self.candidates(message)
+        if self.memo is not None:
+            return self.memo.match_index(self, message, candidates)
+        return self.first_match(message, candidates)
+
+    # Return the index of the first rule in candidates (a bitmask) matching the text the
+    # rules run on, or -1
+    def first_match(self, text, candidates):
+        rules = self.rules
+        while candidates:
+            lowest = candidates & -candidates
+            index = lowest.bit_length() - 1
+            if rules[index].regex.search(text):
+                return index
+            candidates ^= lowest
+        return -1
+
+    # Return the first rule matching the message, or None
+    def match(self, message):
+        index = self.match_index(message)
+        return self.rules[index] if index >= 0 else None
+
+    def find_tickets(self, message):
+        return self.ticket_regex.findall(message)
+
+    def find_ids(self, message):
+        return self.id_regex.findall(message)
+
+    # Return the (tickets, IDs) of a text as tuples. Two findall scans are kept rather
+    # than one alternation with a named group per kind: the backtracking engine tries
+    # every alternative at each position either way, so a combined scan is no faster,
+    # and it would lose IDs that overlap a ticket, like the q123456 in 1-q123456.
+    def find_tokens(self, text):
+        return tuple(self.ticket_regex.findall(text)), tuple(self.id_regex.findall(text))
+
+    # Return an empty result table with every category in report order, "Others" and
+    # the quarantine last
+    def new_result(self):
+        return ResultTable([rule.name for rule in self.rules] + [OTHERS_CATEGORY, QUARANTINE_CATEGORY])
+
+    # Classify one message block as (index of the matching rule or -1, tickets, IDs)
+    def classify_text(self, text):
+        tickets, ids = self.find_tokens(text)
+        return self.match_index(text), tickets, ids
+
+    # Classify texts as (index of the matching rule or -1, tickets, IDs) each
+    def classify_texts(self, texts):
+        return [self.classify_text(text) for text in texts]
+
+    # Classify a Message record: fill in its tickets and IDs and return the index
+    # of the matching rule, or -1
+    def classify(self, message):
+        if message.tickets is None:
+            message.tickets, message.ids = self.find_tokens(message.text)
+        return self.match_index(message.text)
+
+    # Yield (message, rule index, tickets, IDs) for each Message record
+    def classify_all(self, messages):
+        for message in messages:
+            index = self.classify(message)
+            yield message, index, message.tickets, message.ids
+
+    # Add classified messages, given as (message, rule index, tickets, IDs) rows in
+    # their original order, to result (a results.ResultTable). Tickets and IDs are only
+    # added the first time they are seen within this call: the rows are collected, then
+    # added to the table in one go and de-duplicated there. The message is only kept for
+    # "Others" and the quarantine and may be a Message record or its text.
+    def merge(self, classified, result):
+        categories = [result.category_id(rule.name) for rule in self.rules]
+        others = result.category_id(OTHERS_CATEGORY)
+        quarantine = result.category_id(QUARANTINE_CATEGORY)
+        rows = NewRows()
+
+        for position, (message, index, tickets, ids) in enumerate(classified):
+            if index >= 0:
+                rule = self.rules[index]
+                if rule.capture_tickets and tickets:
+                    rows.add(position, message, categories[index], tickets, TICKET)
+                if rule.capture_ids and ids:
+                    rows.add(position, message, categories[index], ids, ID)
+            elif tickets or ids:
+                # If no specific issue is found, keep the message next to each ticket/ID.
+                # A message that went over the time budget is not categorized, so its
+                # tickets/IDs stay free for the categories of later messages.
+                category = quarantine if index == TIMED_OUT else others
+                kept = rows.add_message(message)
+                rows.add(position, message, category, tickets, TICKET, kept)
+                rows.add(position, message, category, ids, ID, kept)
+
+        result.add_new_rows(rows)
+        return result
+
+    # Categorize Message records into result (a results.ResultTable)
+    def categorize(self, messages, result):
+        return self.merge(self.classify_all(messages), result)
+
+
+# Build the engine for a RuleSet loaded from a rules file, as a RuleEngine or a subclass of it
+def engine_from_rules(rules, prefilter=True, engine_class=RuleEngine):
+    return engine_class(rules.issue_patterns, rules.ticket_order_pattern, rules.id_pattern, rules.ids_only,
+                        rules.tickets_only, rules.flags, prefilter, rules.normalize)
+
+
+# Built once per process from the rules file, so Streamlit reruns reuse the compiled rules
+ENGINE = engine_from_rules(RULES)
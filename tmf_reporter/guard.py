@@ -0,0 +1,168 @@
+import multiprocessing
+import time
+from collections import Counter, namedtuple
+from contextlib import contextmanager
+from itertools import islice
+
+from tmf_reporter.engine import ENGINE, TIMED_OUT
+
+# Messages sent to the guarded worker at a time
+BATCH_SIZE = 64
+
+# How long to wait for a new worker to import the package and compile the rules
+START_TIMEOUT = 60
+
+# A message that went over the budget: the rule that was running when it was stopped
+# (None while the ticket/ID patterns ran), seconds spent on it and the message text
+Timeout = namedtuple("Timeout", ["rule", "seconds", "text"])
+
+
+# Classify texts sent over conn, one result per text. Before each pattern runs, state
+# holds the position of the text in its batch and the index of the rule (-1 for the
+# ticket/ID patterns), so the parent can tell which rule was slow after stopping it.
+def _guard_worker(conn, engine, state):
+    engine = engine or ENGINE
+    rules = engine.rules
+    conn.send("ready")
+    while True:
+        try:
+            batch = conn.recv()
+        except EOFError:
+            return
+        if batch is None:
+            return
+        for position, text in enumerate(batch):
+            state[0] = position
+            state[1] = -1
+            tickets, ids = engine.find_tokens(text)
+            index = -1
+            text = engine.rule_text(text)
+            candidates = engine.candidates(text)
+            while candidates:
+                lowest = candidates & -candidates
+                rule = lowest.bit_length() - 1
+                state[1] = rule
+                if rules[rule].regex.search(text):
+                    index = rule
+                    break
+                candidates ^= lowest
+            conn.send((index, tickets, ids))
+
+
+# Classifies Message records in a separate worker process with a time budget per
+# message across all rules. Python's regex engine cannot be interrupted, so a message
+# that goes over the budget is abandoned with its worker, which is replaced for the
+# next message. The message comes back with the TIMED_OUT index and is recorded in
+# timeouts, so a run takes at most about budget seconds per message plus the restart.
+class GuardedMatcher:
+    def __init__(self, engine=ENGINE, budget=2.0, batch_size=BATCH_SIZE):
+        self.engine = engine
+        self.budget = budget
+        self.batch_size = batch_size
+        self.timeouts = []
+        self._process = None
+        self._conn = None
+        self._state = None
+
+    def _start(self):
+        context = multiprocessing.get_context("spawn")
+        self._state = context.RawArray("q", 2)
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(
+            target=_guard_worker,
+            args=(child_conn, None if self.engine is ENGINE else self.engine, self._state),
+            daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+        if not self._conn.poll(START_TIMEOUT):
+            self._stop()
+            raise RuntimeError("the guarded matching worker did not start")
+        self._conn.recv()
+
+    def _stop(self):
+        self._process.kill()
+        self._process.join()
+        self._conn.close()
+        self._process = None
+
+    # Yield (message, rule index, tickets, IDs) rows like RuleEngine.classify_all
+    def classify_all(self, messages):
+        messages = iter(messages)
+        while True:
+            batch = list(islice(messages, self.batch_size))
+            if not batch:
+                return
+            yield from self._classify_batch(batch)
+
+    def _classify_batch(self, batch):
+        while batch:
+            if self._process is None:
+                self._start()
+            self._conn.send([message.text for message in batch])
+            started = time.perf_counter()
+            for position, message in enumerate(batch):
+                try:
+                    finished = self._conn.poll(max(started + self.budget - time.perf_counter(), 0))
+                    row = self._conn.recv() if finished else None
+                except (EOFError, OSError):
+                    row = None
+                if row is None:
+                    yield self._quarantine(message, time.perf_counter() - started)
+                    batch = batch[position + 1:]
+                    break
+                started = time.perf_counter()
+                index, message.tickets, message.ids = row
+                yield message, index, message.tickets, message.ids
+            else:
+                batch = []
+
+    def _quarantine(self, message, seconds):
+        rule = self._state[1]
+        self._stop()
+        self.timeouts.append(Timeout(self.engine.rules[rule].name if rule >= 0 else None, seconds, message.text))
+        # The ticket/ID patterns are simple, so they are safe to run here
+        message.tickets, message.ids = self.engine.find_tokens(message.text)
+        return message, TIMED_OUT, message.tickets, message.ids
+
+    def close(self):
+        if self._process is not None:
+            try:
+                self._conn.send(None)
+            except OSError:
+                pass
+            self._process.join(1)
+            if self._process.is_alive():
+                self._process.kill()
+                self._process.join()
+            self._conn.close()
+            self._process = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# Context manager giving a GuardedMatcher for one run when budget is set, or None
+@contextmanager
+def guarded(engine=ENGINE, budget=None):
+    if not budget:
+        yield None
+        return
+    with GuardedMatcher(engine, budget) as guard:
+        yield guard
+
+
+# Rows of the slow-rule report: how many messages each rule stopped, and the longest
+# of them, most frequent first
+def slow_rule_report(timeouts):
+    counts = Counter(timeout.rule for timeout in timeouts)
+    longest = {}
+    for timeout in timeouts:
+        longest[timeout.rule] = max(longest.get(timeout.rule, 0), len(timeout.text))
+    return [
+        {"Rule": rule or "(ticket/ID patterns)", "Messages": count, "Longest message (chars)": longest[rule]}
+        for rule, count in counts.most_common()
+    ]
@@ -0,0 +1,121 @@
+import datetime
+import hashlib
+import os
+import sqlite3
+import threading
+
+from tmf_reporter.incremental import default_data_dir
+from tmf_reporter.results import TICKET
+
+# Days covered by the daily category counts
+TREND_DAYS = 90
+
+
+# Function to build the key of a run from what decides its result (process, uploads,
+# rule-set version, settings), so the same run is recorded once
+def run_key(*parts):
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+
+# Local history of categorization runs: one row per run and one per reported ticket/ID
+# with its category, the time, sender and file of its message and the run it came from.
+# Values are kept upper-cased as in the report, so lookups ignore case. day is the
+# message's date, or the run's date when the message has no timestamp.
+class HistoryStore:
+    def __init__(self, path=None):
+        if path is None:
+            path = os.path.join(default_data_dir(), "history.sqlite3")
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, run_key TEXT UNIQUE, started TEXT, process TEXT,
+                files TEXT, rules_version TEXT, hits INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS hits (
+                run_id INTEGER REFERENCES runs (id), value TEXT, kind TEXT, category TEXT, message_time TEXT,
+                day TEXT, sender TEXT, file_name TEXT
+            );
+            CREATE INDEX IF NOT EXISTS hits_value ON hits (value);
+            CREATE INDEX IF NOT EXISTS hits_category_day ON hits (category, day);
+            CREATE INDEX IF NOT EXISTS hits_run ON hits (run_id);
+        """)
+        self._db.commit()
+
+    # Record the hits of a finished run (a results.ResultTable). process names what was
+    # run and files the exports it read. A run_key (e.g. a hash of the files and rules)
+    # that was recorded before is not recorded again, so re-showing a cached run does not
+    # count it twice. Returns the run id, or None if the run was already recorded.
+    def record_run(self, result, process, files, rules_version, run_key=None, now=None):
+        now = now or datetime.datetime.now()
+        started = now.strftime("%Y-%m-%d %H:%M:%S")
+        today = started[:10]
+        with self._lock, self._db:
+            cursor = self._db.execute(
+                "INSERT OR IGNORE INTO runs (run_key, started, process, files, rules_version, hits) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (run_key, started, process, ", ".join(files), rules_version, len(result)),
+            )
+            if not cursor.rowcount:
+                return None
+            run_id = cursor.lastrowid
+            self._db.executemany(
+                "INSERT INTO hits VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (run_id, row.value.upper(), "ticket" if row.kind == TICKET else "id", row.category, row.time,
+                     row.time[:10] or today, row.sender, row.file_name)
+                    for row in result.rows()
+                ),
+            )
+        return run_id
+
+    def _query(self, sql, parameters=()):
+        with self._lock:
+            cursor = self._db.execute(sql, parameters)
+            columns = [column[0] for column in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    # Earlier reports of a ticket/ID, newest run first: when and under which category
+    def lookup(self, value, limit=200):
+        return self._query(
+            "SELECT runs.started AS run, hits.category, hits.message_time, hits.sender, hits.file_name, runs.process "
+            "FROM hits JOIN runs ON runs.id = hits.run_id WHERE hits.value = ? "
+            "ORDER BY hits.run_id DESC, hits.rowid LIMIT ?",
+            (value.strip().upper(), limit),
+        )
+
+    # Hits per day and category over the last days (counted back from today)
+    def daily_counts(self, days=TREND_DAYS, today=None):
+        today = today or datetime.date.today()
+        since = (today - datetime.timedelta(days=days - 1)).isoformat()
+        return self._query(
+            "SELECT day, category, COUNT(*) AS hits FROM hits WHERE day >= ? GROUP BY day, category ORDER BY day",
+            (since,),
+        )
+
+    # Tickets/IDs reported by at least min_runs different runs, most runs first
+    def recurring(self, min_runs=2, limit=200):
+        return self._query(
+            "SELECT value, COUNT(DISTINCT run_id) AS runs, MIN(day) AS first_seen, MAX(day) AS last_seen, "
+            "GROUP_CONCAT(DISTINCT category) AS categories FROM hits GROUP BY value "
+            "HAVING COUNT(DISTINCT run_id) >= ? ORDER BY runs DESC, last_seen DESC LIMIT ?",
+            (min_runs, limit),
+        )
+
+    # The latest runs, newest first
+    def runs(self, limit=20):
+        return self._query(
+            "SELECT id, started, process, files, rules_version, hits FROM runs ORDER BY id DESC LIMIT ?", (limit,)
+        )
+
+    # Forget all recorded runs
+    def reset(self):
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM hits")
+            self._db.execute("DELETE FROM runs")
+
+    def close(self):
+        self._db.close()
@@ -0,0 +1,194 @@
+import hashlib
+import os
+import sqlite3
+import threading
+from itertools import chain
+
+from tmf_reporter.engine import ENGINE
+from tmf_reporter.jobs import ticked
+from tmf_reporter.message import parse_messages, parse_pieces
+from tmf_reporter.parallel import categorize
+from tmf_reporter.pipeline import iter_cleansed_pieces, tee
+from tmf_reporter.results import ResultTable
+from tmf_reporter.rules import MESSAGE_CATEGORIES
+
+
+# Folder for local state (incremental store, history), overridable with TMF_REPORTER_DATA_DIR
+def default_data_dir():
+    return os.environ.get("TMF_REPORTER_DATA_DIR") or os.path.join(os.path.expanduser("~"), ".tmf_reporter")
+
+
+def _digest(*parts):
+    return hashlib.blake2b("\x1f".join(parts).encode("utf-8"), digest_size=12).hexdigest()
+
+
+# Function to fingerprint a Message record by its timestamp, sender and body, with
+# the body lowercased and whitespace collapsed so raw and cleansed copies compare equal.
+# Returns (message time, fingerprint, body hash).
+def fingerprint(message):
+    body_hash = _digest(" ".join(message.body.lower().split()))
+    return message.time, _digest(message.time, message.sender.lower(), body_hash), body_hash
+
+
+# Local store of the messages already categorized (fingerprints), the latest message
+# time seen per export file (watermark) and the report built from them so far
+class IncrementalStore:
+    def __init__(self, path=None):
+        if path is None:
+            path = os.path.join(default_data_dir(), "incremental.sqlite3")
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS seen (fingerprint TEXT PRIMARY KEY, message_time TEXT, source TEXT);
+            CREATE TABLE IF NOT EXISTS watermarks (source TEXT PRIMARY KEY, message_time TEXT);
+            CREATE TABLE IF NOT EXISTS report (seq INTEGER PRIMARY KEY AUTOINCREMENT, category TEXT, value TEXT, message TEXT,
+                                               kind INTEGER NOT NULL DEFAULT 0);
+        """)
+        # Stores made before the kind of each hit was kept, which read back as tickets
+        if "kind" not in [column[1] for column in self._db.execute("PRAGMA table_info(report)")]:
+            self._db.execute("ALTER TABLE report ADD COLUMN kind INTEGER NOT NULL DEFAULT 0")
+        self._db.commit()
+
+    def watermark(self, source):
+        with self._lock:
+            row = self._db.execute("SELECT message_time FROM watermarks WHERE source = ?", (source,)).fetchone()
+        return row[0] if row else ""
+
+    def is_seen(self, fp):
+        with self._lock:
+            return self._db.execute("SELECT 1 FROM seen WHERE fingerprint = ?", (fp,)).fetchone() is not None
+
+    # Return the report stored by earlier runs as a results.ResultTable, like a categorization result
+    def previous_result(self, engine=ENGINE):
+        result = engine.new_result()
+        with self._lock:
+            rows = self._db.execute("SELECT category, value, kind, message FROM report ORDER BY seq").fetchall()
+        for category, value, kind, message in rows:
+            result.append(category, value, kind, message=message if category in MESSAGE_CATEGORIES else None)
+        return result
+
+    # Record a finished run: the messages it categorized, the new watermarks and its hits
+    def commit(self, seen, watermarks, result):
+        rows = [(row.category, row.value, None if row.message is None else str(row.message), row.kind)
+                for row in result.rows()]
+        with self._lock, self._db:
+            self._db.executemany("INSERT OR IGNORE INTO seen VALUES (?, ?, ?)", seen)
+            self._db.executemany(
+                "INSERT INTO watermarks VALUES (?, ?) ON CONFLICT(source) DO UPDATE SET message_time = "
+                "max(message_time, excluded.message_time)",
+                watermarks.items(),
+            )
+            self._db.executemany("INSERT INTO report (category, value, message, kind) VALUES (?, ?, ?, ?)", rows)
+
+    # Forget everything, so the next run categorizes full exports again
+    def reset(self):
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM seen")
+            self._db.execute("DELETE FROM watermarks")
+            self._db.execute("DELETE FROM report")
+
+    def close(self):
+        self._db.close()
+
+
+# Filters a stream of (source, Message) pairs down to the messages not seen before:
+# older than the source's watermark, already fingerprinted by an earlier run or earlier
+# in this one, or with the same body as a message taken from another export of this run
+# (e.g. forwarded into it). The bodies of an export only count once it is done, so the
+# same text sent again within one export, like a repeated report, is kept.
+class NewMessageFilter:
+    def __init__(self, store):
+        self.store = store
+        self.seen = []
+        self.watermarks = {}
+        self.new = 0
+        self.skipped = 0
+        self.hits = None
+        self._old_watermarks = {}
+        self._run_fingerprints = set()
+        self._run_bodies = set()
+        self._source = None
+        self._source_bodies = set()
+
+    def _is_old(self, source, message_time):
+        if source not in self._old_watermarks:
+            self._old_watermarks[source] = self.store.watermark(source)
+        watermark = self._old_watermarks[source]
+        # Messages in the watermark's own minute may not all have been seen yet
+        return bool(message_time and watermark and message_time < watermark)
+
+    def __call__(self, records):
+        for source, message in records:
+            if source != self._source:
+                self._run_bodies |= self._source_bodies
+                self._source, self._source_bodies = source, set()
+            message_time, fp, body_hash = fingerprint(message)
+            if (self._is_old(source, message_time) or fp in self._run_fingerprints
+                    or body_hash in self._run_bodies or self.store.is_seen(fp)):
+                self.skipped += 1
+                continue
+            self._run_fingerprints.add(fp)
+            self._source_bodies.add(body_hash)
+            self.seen.append((fp, message_time, source))
+            if message_time > self.watermarks.get(source, ""):
+                self.watermarks[source] = message_time
+            self.new += 1
+            yield message
+
+
+# Function to drop tickets/IDs that an earlier report already has
+def drop_reported(result, previous):
+    result.drop_values(previous.row_values())
+    return result
+
+
+# Function to append a new result to a previous one, category by category
+def merge_results(previous, new):
+    merged = ResultTable()
+    merged.extend(previous)
+    merged.extend(new)
+    return merged
+
+
+# Function to categorize only the messages not processed by earlier runs.
+# sources is a list of (file name, string or file object) pairs. With base_names,
+# sources are raw exports that are cleansed first, as in the single-pass pipeline.
+# Returns (result, filter): the new ticket/ID hits, or the previous report with them
+# appended when merge_previous is set, and the filter with the new/skipped counts and,
+# in its hits, the new ticket/ID hits alone.
+# tick, if given, is called for every message read from sources, before cleansing when
+# they are raw exports (see cleansing.count_filtered_messages).
+def categorize_incremental(sources, store, engine=ENGINE, workers=1, merge_previous=False,
+                           base_names=None, cleansed_output=None, match_anywhere=False, guard=None, tick=None):
+    if base_names is None:
+        records = chain.from_iterable(
+            ((name, message) for message in parse_messages(source, file_name=name)) for name, source in sources
+        )
+    else:
+        def cleansed_records(i, name, source):
+            pieces = iter_cleansed_pieces([(name, source)], base_names, match_anywhere, tick)
+            if cleansed_output is not None:
+                if i:
+                    cleansed_output.write("\n\n")
+                pieces = tee(pieces, cleansed_output)
+            return ((name, message) for message in parse_pieces(pieces, name))
+
+        records = chain.from_iterable(cleansed_records(i, name, source) for i, (name, source) in enumerate(sources))
+
+    if tick is not None and base_names is None:
+        records = ticked(records, tick)
+
+    new_messages = NewMessageFilter(store)
+    result = categorize(new_messages(records), engine.new_result(), engine=engine, workers=workers, guard=guard)
+
+    previous = store.previous_result(engine)
+    drop_reported(result, previous)
+    store.commit(new_messages.seen, new_messages.watermarks, result)
+
+    new_messages.hits = result
+    if merge_previous:
+        result = merge_results(previous, result)
+    return result, new_messages
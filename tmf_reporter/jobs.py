@@ -0,0 +1,216 @@
+import io
+import threading
+import time
+import traceback
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from tmf_reporter.parser import count_messages
+
+MB = 1 << 20
+
+# Jobs running at once, for all sessions together; later ones wait in the queue. The
+# work of a job runs in this process, or on the shared process pool with all cores on.
+JOB_WORKERS = 2
+
+# Finished jobs kept for fetching their output, oldest dropped first, and for how long
+KEEP_JOBS = 32
+JOB_TTL = 12 * 3600
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+FINISHED = (DONE, FAILED, CANCELLED)
+
+
+# Raised inside the work of a job that was cancelled, to stop it
+class JobCancelled(Exception):
+    pass
+
+
+# Copy of an upload for a job, which outlives the script run that received it, with
+# the name, size and getvalue() of Streamlit's UploadedFile
+class UploadCopy(io.BytesIO):
+    def __init__(self, upload):
+        super().__init__(upload.getvalue())
+        self.name = upload.name
+        self.size = self.getbuffer().nbytes
+
+
+# Yield items, calling tick() before each
+def ticked(items, tick):
+    for item in items:
+        tick()
+        yield item
+
+
+# One background run. Its progress is counted in messages processed out of the
+# messages of its files (see count_files): the work calls tick() for each message, in
+# the unit count_files counted, and file_progress() with the multifile.FileProgress of
+# each file, and both raise JobCancelled once the job was cancelled (tick(0) only
+# checks). output is what the work returned, error the traceback of a failed job.
+class Job:
+    def __init__(self, name, key=None):
+        self.id = uuid.uuid4().hex[:12]
+        self.name = name
+        self.key = key
+        self.state = QUEUED
+        self.output = None
+        self.error = None
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self.total = 0
+        self._file_totals = []
+        self._files = []
+        self._finished_files = 0
+        self._current = 0
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+
+    # Count the messages of uploads with count, the total the progress is measured
+    # against: the message blocks by default, or e.g. cleansing.count_filtered_messages
+    # for work that ticks as it cleanses
+    def count_files(self, uploads, count=count_messages):
+        totals = [count(upload) for upload in uploads]
+        with self._lock:
+            self._file_totals = totals
+            self._files = [
+                {"File": upload.name, "Status": "waiting", "MB": round(upload.size / MB, 2), "Messages": None,
+                 "Seconds": None, "MB/s": None}
+                for upload in uploads
+            ]
+            self.total = sum(totals)
+
+    def tick(self, messages=1):
+        if self._cancel.is_set():
+            raise JobCancelled()
+        with self._lock:
+            self._current += messages
+
+    def file_progress(self, event):
+        if self._cancel.is_set():
+            raise JobCancelled()
+        with self._lock:
+            row = self._files[event.index]
+            row["Status"] = event.state
+            if event.state == "done":
+                row["Messages"] = event.messages
+                row["Seconds"] = round(event.seconds, 2)
+                row["MB/s"] = round(event.bytes / MB / event.seconds, 2) if event.seconds else None
+                self._finished_files += self._file_totals[event.index]
+                self._current = 0
+
+    # Messages processed so far
+    @property
+    def messages(self):
+        if self.state == DONE:
+            return self.total
+        with self._lock:
+            return min(self._finished_files + self._current, self.total)
+
+    # Fraction of the messages processed, from 0 to 1
+    @property
+    def progress(self):
+        if self.state == DONE:
+            return 1.0
+        return self.messages / self.total if self.total else 0.0
+
+    # Seconds the job has been running, or ran
+    @property
+    def seconds(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.time()) - self.started
+
+    # The per-file status rows, like the progress table of a run in the app
+    def file_rows(self):
+        with self._lock:
+            return [dict(row) for row in self._files]
+
+    # Stop the job: a queued job does not start, a running one stops at its next message
+    def cancel(self):
+        self._cancel.set()
+        with self._lock:
+            if self.state == QUEUED:
+                self.state = CANCELLED
+                self.finished = time.time()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+
+# Runs jobs on a bounded pool of threads shared by all sessions and keeps them by id, so
+# a job's progress and output can be fetched again, e.g. after a browser refresh.
+class JobQueue:
+    def __init__(self, workers=JOB_WORKERS, keep=KEEP_JOBS, ttl=JOB_TTL):
+        self.keep = keep
+        self.ttl = ttl
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tmf-job")
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    # Queue fn(job, *args, **kwargs) as a job named name and return the Job. With key,
+    # a job with the same key that is queued, running or done is returned instead, so the
+    # same work submitted from several sessions runs once.
+    def submit(self, name, fn, *args, key=None, **kwargs):
+        with self._lock:
+            self._prune()
+            if key is not None:
+                for job in self._jobs.values():
+                    if job.key == key and job.state not in (FAILED, CANCELLED) and not job.cancelled:
+                        return job
+            job = Job(name, key)
+            self._jobs[job.id] = job
+        self._executor.submit(self._run, job, fn, args, kwargs)
+        return job
+
+    def _run(self, job, fn, args, kwargs):
+        with job._lock:
+            if job.state != QUEUED:
+                return
+            job.state = RUNNING
+            job.started = time.time()
+        try:
+            job.output = fn(job, *args, **kwargs)
+            state = DONE
+        except JobCancelled:
+            state = CANCELLED
+        except Exception:
+            job.error = traceback.format_exc()
+            state = FAILED
+        job.finished = time.time()
+        job.state = state
+
+    # The job with id job_id, or None if there is none (any more)
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    # Number of queued jobs submitted before job
+    def ahead(self, job):
+        with self._lock:
+            return sum(1 for other in self._jobs.values() if other.state == QUEUED and other.submitted < job.submitted)
+
+    # All jobs kept, newest first
+    def jobs(self):
+        with self._lock:
+            return list(reversed(self._jobs.values()))
+
+    # Drop finished jobs past the ttl, then the oldest finished ones past keep
+    def _prune(self):
+        now = time.time()
+        finished = [job for job in self._jobs.values() if job.state in FINISHED]
+        for i, job in enumerate(finished):
+            if now - job.finished > self.ttl or i < len(finished) - self.keep:
+                del self._jobs[job.id]
+
+    def shutdown(self):
+        for job in self.jobs():
+            job.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,129 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+try:
+    import re._parser as sre_parse
+    import re._constants as sre_constants
+except ImportError:  # Python < 3.11
+    import sre_parse
+    import sre_constants
+
+# Decisions kept per engine, least recently used dropped first
+MEMO_SIZE = 50000
+
+# Every digit masked to 0, which masks the ticket/order numbers and IDs
+_MASK = str.maketrans("123456789", "000000000")
+
+_DIGITS = set(range(ord("0"), ord("9") + 1))
+
+_REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT, getattr(sre_constants, "POSSESSIVE_REPEAT", None))
+
+
+# True when a pattern can tell digits apart: a digit literal, a class with some digits
+# but not all (like [1-9]), or a back-reference. A pattern that cannot matches texts
+# that only differ in their digits alike.
+def tells_digits_apart(pattern, flags=0):
+    return _tells_digits_apart(sre_parse.parse(pattern, flags))
+
+
+def _tells_digits_apart(items):
+    for op, av in items:
+        if op in (sre_constants.LITERAL, sre_constants.NOT_LITERAL):
+            if av in _DIGITS:
+                return True
+        elif op is sre_constants.IN:
+            chars = set()
+            for item_op, item_av in av:
+                if item_op is sre_constants.LITERAL:
+                    chars.add(item_av)
+                elif item_op is sre_constants.RANGE:
+                    chars.update(range(max(item_av[0], ord("0")), min(item_av[1], ord("9")) + 1))
+            if chars & _DIGITS and not _DIGITS <= chars:
+                return True
+        elif op in _REPEATS:
+            if _tells_digits_apart(av[2]):
+                return True
+        elif op is sre_constants.SUBPATTERN:
+            if _tells_digits_apart(av[-1]):
+                return True
+        elif op is sre_constants.BRANCH:
+            if any(_tells_digits_apart(branch) for branch in av[1]):
+                return True
+        elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            if _tells_digits_apart(av[1]):
+                return True
+        elif op is getattr(sre_constants, "ATOMIC_GROUP", None):
+            if _tells_digits_apart(av):
+                return True
+        elif op in (sre_constants.GROUPREF, sre_constants.GROUPREF_EXISTS):
+            return True
+    return False
+
+
+# Remembers the rule decision for each shape of message: its text with every digit
+# masked, so the same template with another ticket/ID is one entry. Most rules cannot
+# tell digits apart and decide the same for every message of a shape; on a repeat only
+# the others run again, up to the remembered rule, so the decision is the same as
+# running the whole rule chain. Bounded to size entries, least recently used dropped
+# first. Belongs to one RuleEngine, so a changed rule set starts with an empty memo.
+class DecisionMemo:
+    def __init__(self, rules, size=MEMO_SIZE):
+        self.size = size
+        # Bitmask of the rules that tell digits apart
+        self.digit_rules = 0
+        for i, rule in enumerate(rules):
+            if tells_digits_apart(rule.regex.pattern, rule.regex.flags):
+                self.digit_rules |= 1 << i
+        self.hits = 0
+        self.lookups = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    # Worker processes get an empty memo of their own
+    def __getstate__(self):
+        return {"size": self.size, "digit_rules": self.digit_rules}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.hits = 0
+        self.lookups = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    # Return the index of the first rule of engine matching text (the text the rules run
+    # on), or -1; candidates is the engine's prefilter bitmask for text
+    def match_index(self, engine, text, candidates):
+        key = hashlib.blake2b(text.translate(_MASK).encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        with self._lock:
+            self.lookups += 1
+            index = self._entries.get(key)
+            if index is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+        if index is None:
+            index = engine.first_match(text, candidates)
+            with self._lock:
+                self._entries[key] = index
+                if len(self._entries) > self.size:
+                    self._entries.popitem(last=False)
+            return index
+
+        # The rules that tell digits apart, up to the remembered one, may decide otherwise
+        upto = (2 << index) - 1 if index >= 0 else -1
+        found = engine.first_match(text, candidates & self.digit_rules & upto)
+        if found >= 0 or index < 0 or not self.digit_rules >> index & 1:
+            return found if found >= 0 else index
+        # The remembered rule itself tells digits apart and no longer matches
+        return engine.first_match(text, candidates & ~upto)
+
+    # (hits, lookups) so far
+    def stats(self):
+        with self._lock:
+            return self.hits, self.lookups
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.lookups = 0
@@ -0,0 +1,84 @@
+import re
+from collections import namedtuple
+
+from tmf_reporter.parser import CHUNK_SIZE, iter_message_records, split_piece_records
+
+DATE_PATTERN = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})')
+TIME_PATTERN = re.compile(r'(\d{1,2}):(\d{2})(?: ?([ap]m))?', re.IGNORECASE)
+
+# A "name: " prefix longer than this is taken as part of the message, not a sender
+MAX_SENDER_LENGTH = 60
+
+
+# Function to turn any of the timestamp header formats into "YYYY-MM-DD HH:MM", or "" if it has none
+def parse_header_time(header):
+    date = DATE_PATTERN.search(header)
+    time = TIME_PATTERN.search(header)
+    if not date or not time:
+        return ""
+    day, month, year = (int(part) for part in date.groups())
+    hour, minute = int(time.group(1)), int(time.group(2))
+    meridiem = (time.group(3) or "").lower()
+    if meridiem == "pm" and hour < 12:
+        hour += 12
+    elif meridiem == "am" and hour == 12:
+        hour = 0
+    return f"{year:04d}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}"
+
+
+# One message block of an export, parsed once. text is the block exactly as the
+# category rules see it, time is its timestamp as "YYYY-MM-DD HH:MM" ("" if it has
+# none), sender and body are split at the first ": " and offset is where the block
+# starts in the UTF-8 input. file_name is the export it came from, if known.
+# tickets and ids are filled in by RuleEngine.classify.
+class Message:
+    __slots__ = ("text", "time", "sender", "body", "offset", "file_name", "tickets", "ids")
+
+    def __init__(self, text, header="", offset=0, file_name=""):
+        self.text = text
+        self.time = parse_header_time(header) if header else ""
+        stripped = text.strip()
+        sender, sep, body = stripped.partition(": ")
+        if not sep or len(sender) > MAX_SENDER_LENGTH:
+            sender, body = "", stripped
+        self.sender = sender.strip()
+        self.body = body
+        self.offset = offset
+        self.file_name = file_name
+        self.tickets = None
+        self.ids = None
+
+    # Reports print a message as its text
+    def __str__(self):
+        return self.text
+
+    def __repr__(self):
+        return f"Message(time={self.time!r}, sender={self.sender!r}, offset={self.offset}, body={self.body[:40]!r})"
+
+
+# Where a message came from, without its text: what the results keep of a message
+# that is not printed in the report
+MessageOrigin = namedtuple("MessageOrigin", ["time", "sender", "file_name"])
+
+
+def _encoded_length(text):
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+# Turn (header, block) records that follow each other in a text into Message records
+def messages_from_records(records, file_name=""):
+    offset = 0
+    for header, block in records:
+        offset += _encoded_length(header)
+        yield Message(block, header, offset, file_name)
+        offset += _encoded_length(block)
+
+
+# Yield the message blocks of an export as Message records, streaming like iter_messages
+def parse_messages(source, chunk_size=CHUNK_SIZE, file_name=""):
+    return messages_from_records(iter_message_records(source, chunk_size), file_name)
+
+
+# Yield the message blocks of text that arrives in pieces as Message records, like split_pieces
+def parse_pieces(pieces, file_name=""):
+    return messages_from_records(split_piece_records(pieces), file_name)
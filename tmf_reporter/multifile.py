@@ -0,0 +1,246 @@
+import io
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, wait
+from itertools import islice
+
+from tmf_reporter.cleansing import filter_messages, iter_filtered_messages
+from tmf_reporter.engine import ENGINE
+from tmf_reporter.jobs import ticked
+from tmf_reporter.message import Message, MessageOrigin, parse_messages, parse_pieces
+from tmf_reporter.parallel import POOL_WORKERS, classify, engine_ref, get_executor, worker_engine
+from tmf_reporter.pipeline import cleansed_banner
+from tmf_reporter.profiling import NAME_FILTER, SPLIT
+
+# What is done to each file
+CLEANSE = "cleanse"
+CATEGORIZE = "categorize"
+PIPELINE = "pipeline"
+
+# Seconds between checks for a cancelled run while files are processed in the pool
+CANCEL_CHECK = 0.5
+
+# Progress of one file, passed to the progress callback when it is queued and when it is done
+FileProgress = namedtuple("FileProgress", ["index", "name", "state", "bytes", "messages", "seconds"])
+
+# What a worker sends back for one file. rows are (message, rule index, tickets, IDs) in
+# file order, where the message is the Message record where it can end up under "Others",
+# a MessageOrigin for the other rows with tickets/IDs and None for the rest. For the
+# pipeline, head and tail are the file's first and last blocks (Message records), which
+# run on into the neighbouring files and are classified once the files are joined.
+FileResult = namedtuple("FileResult", ["cleansed", "rows", "head", "tail", "messages", "bytes", "seconds"])
+
+
+def _compact(rows):
+    return [
+        (None if not (tickets or ids) else message if index < 0
+         else MessageOrigin(message.time, message.sender, message.file_name), index, tickets, ids)
+        for message, index, tickets, ids in rows
+    ]
+
+
+# Yield all messages but the last, which is left in last[0]
+def _all_but_last(messages, last):
+    for message in messages:
+        if last[0] is not None:
+            yield last[0]
+        last[0] = message
+
+
+def _counted(items, counts):
+    for item in items:
+        counts[0] += 1
+        yield item
+
+
+# Yield the cleansed pieces of one export to parse, its banner and then the kept
+# messages with their separators, writing all but the banner to output
+def _cleansed_pieces(name, kept, output):
+    yield cleansed_banner(name)
+    for i, message in enumerate(kept):
+        if i:
+            output.write("\n\n")
+            yield "\n\n"
+        output.write(message)
+        yield message
+
+
+def _size(data):
+    return len(data) if isinstance(data, bytes) else getattr(data, "size", 0)
+
+
+# Process one export, in a pool worker (data is then its bytes) or in this process
+# (data can be the upload itself). workers, guard, profile and tick only apply in this
+# process; tick, if given, is called for every message read, before cleansing when the
+# export is cleansed (see cleansing.count_filtered_messages).
+def process_file(name, data, mode, base_names=None, match_anywhere=False, engine=None, workers=1, guard=None,
+                 profile=None, tick=None):
+    engine = engine or worker_engine()
+    start = time.perf_counter()
+    source = io.BytesIO(data) if isinstance(data, bytes) else data
+    cleansed, rows, head, tail, count = None, [], None, None, 0
+    if profile is not None:
+        source = profile.text(source)
+
+    # Messages are streamed from the export into the rules, so only the rows with
+    # tickets/IDs are kept, not every message of the file
+    if mode == CATEGORIZE:
+        messages = parse_messages(source, file_name=name)
+        if profile is not None:
+            messages = profile.timed(SPLIT, messages)
+        counts = [0]
+        rows = classify(_counted(messages, counts), engine, workers, guard)
+        rows = _compact(ticked(rows, tick) if tick is not None else rows)
+        count = counts[0]
+    elif mode == PIPELINE:
+        kept = iter_filtered_messages(source, base_names, match_anywhere, tick)
+        if profile is not None:
+            kept = profile.timed(NAME_FILTER, kept)
+        output = io.StringIO()
+        messages = parse_pieces(_cleansed_pieces(name, kept, output), file_name=name)
+        if profile is not None:
+            messages = profile.timed(SPLIT, messages)
+        head = next(messages)
+        last = [None]
+        rows = classify(_all_but_last(messages, last), engine, workers, guard)
+        rows = _compact(rows)
+        tail = last[0]
+        count = len(rows) + 1 + (tail is not None)
+        cleansed = output.getvalue()
+    else:
+        if profile is not None:
+            kept = profile.timed(NAME_FILTER, iter_filtered_messages(source, base_names, match_anywhere, tick))
+            cleansed = "\n\n".join(kept)
+        else:
+            cleansed = filter_messages(source, base_names, match_anywhere, tick)
+        count = cleansed.count("\n\n") + 1 if cleansed else 0
+    if profile is not None:
+        source.close()
+
+    return FileResult(cleansed, rows, head, tail, count, _size(data), time.perf_counter() - start)
+
+
+# process_file in a worker of the shared pool, with the engine named by ref (see parallel.engine_ref)
+def _process_file_task(ref, name, data, mode, base_names, match_anywhere):
+    return process_file(name, data, mode, base_names, match_anywhere, worker_engine(ref))
+
+
+# Process uploads (objects with .name and .getvalue(), like Streamlit's) one file per
+# task, on the shared process pool when workers is not 1 and there are several files,
+# with at most two files per worker (workers of the pool's, up to the number of files)
+# in flight. Returns the FileResults in upload order.
+# progress, if given, is called with a FileProgress as each file is queued and done.
+# With guard (a guard.GuardedMatcher), files are categorized one after another through it.
+# With profile (a profiling.RunProfile), they are processed one after another in this
+# process and timed; engine should then be profile.engine. tick, if given, is called for
+# every message of the files processed in this process (see process_file), and with 0
+# every CANCEL_CHECK seconds while files are processed in the pool.
+def process_files(uploaded_files, mode, base_names=None, match_anywhere=False, engine=ENGINE, workers=1,
+                  progress=None, guard=None, profile=None, tick=None):
+    def report(i, state, result=None):
+        if progress is not None:
+            upload = uploaded_files[i]
+            size = result.bytes if result else _size(upload)
+            progress(FileProgress(i, upload.name, state, size, result.messages if result else 0,
+                                  result.seconds if result else 0.0))
+
+    results = [None] * len(uploaded_files)
+    if workers == 1 or len(uploaded_files) == 1 or guard is not None or profile is not None:
+        for i, upload in enumerate(uploaded_files):
+            report(i, "processing")
+            results[i] = process_file(upload.name, upload, mode, base_names, match_anywhere, engine, workers, guard,
+                                      profile, tick)
+            report(i, "done", results[i])
+        return results
+
+    workers = min(workers or POOL_WORKERS, POOL_WORKERS, len(uploaded_files))
+    executor = get_executor()
+    ref = engine_ref(engine)
+    pending = {}
+    queue = iter(enumerate(uploaded_files))
+    try:
+        while True:
+            for i, upload in islice(queue, 2 * workers - len(pending)):
+                future = executor.submit(_process_file_task, ref, upload.name, upload.getvalue(), mode, base_names,
+                                         match_anywhere)
+                pending[future] = i
+                report(i, "processing")
+            if not pending:
+                return results
+            done, _ = wait(pending, timeout=CANCEL_CHECK, return_when=FIRST_COMPLETED)
+            # tick(0) raises once a job running this was cancelled, see jobs.Job
+            if tick is not None:
+                tick(0)
+            for future in done:
+                i = pending.pop(future)
+                results[i] = future.result()
+                report(i, "done", results[i])
+    finally:
+        # Stopped early: the files not started yet are dropped from the pool
+        for future in pending:
+            future.cancel()
+
+
+# Function to cleanse several uploads, laid out like the cleansing step's download
+def cleanse_files(uploaded_files, base_names, match_anywhere=False, workers=1, progress=None, profile=None, tick=None):
+    results = process_files(uploaded_files, CLEANSE, base_names, match_anywhere, workers=workers, progress=progress,
+                            profile=profile, tick=tick)
+    return "\n\n".join(
+        f"{cleansed_banner(upload.name)}{result.cleansed}" for upload, result in zip(uploaded_files, results)
+    )
+
+
+# Function to categorize several uploads into result, each file with its own ticket/ID
+# de-duplication, the same as categorizing them one after another. With profile (a
+# profiling.RunProfile), the run is timed through its engine, in this process.
+def categorize_files(uploaded_files, result, engine=ENGINE, workers=1, progress=None, guard=None, profile=None,
+                     tick=None):
+    if profile is not None:
+        engine, workers = profile.engine, 1
+    for file_result in process_files(uploaded_files, CATEGORIZE, engine=engine, workers=workers, progress=progress,
+                                     guard=guard, profile=profile, tick=tick):
+        engine.merge(file_result.rows, result)
+    return result
+
+
+# Yield the rows of the joined cleansed text of all files, classifying the blocks that
+# span two files (a file's last block runs on into the next file's banner) here. Such a
+# block keeps the time, sender and file of the block it starts with.
+def _joined_rows(results, engine, guard=None):
+    def classify_block(text, start):
+        message = Message(text, file_name=start.file_name)
+        message.time = start.time
+        if guard is not None:
+            return next(guard.classify_all([message]))
+        tickets, ids = engine.find_tokens(text)
+        return message, engine.match_index(text), tickets, ids
+
+    pending = None
+    for result in results:
+        if pending is None:
+            first = (result.head.text, result.head)
+        else:
+            first = (f"{pending[0]}\n\n{result.head.text}", pending[1])
+        if result.tail is None:
+            pending = first
+            continue
+        yield classify_block(*first)
+        yield from result.rows
+        pending = (result.tail.text, result.tail)
+    if pending is not None:
+        yield classify_block(*pending)
+
+
+# Function to cleanse and categorize several uploads in one pass, with the same result
+# and cleansed text as pipeline.cleanse_and_categorize. Returns (result, cleansed text).
+def cleanse_and_categorize_files(uploaded_files, base_names, match_anywhere=False, engine=ENGINE, workers=1,
+                                 progress=None, guard=None, profile=None, tick=None):
+    if profile is not None:
+        engine, workers = profile.engine, 1
+    results = process_files(uploaded_files, PIPELINE, base_names, match_anywhere, engine, workers, progress, guard,
+                            profile, tick)
+    result = engine.merge(_joined_rows(results, engine, guard), engine.new_result())
+    cleansed = "\n\n".join(
+        f"{cleansed_banner(upload.name)}{file_result.cleansed}" for upload, file_result in zip(uploaded_files, results)
+    )
+    return result, cleansed
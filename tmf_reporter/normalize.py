@@ -0,0 +1,109 @@
+import re
+
+try:
+    import re._parser as sre_parse
+    import re._constants as sre_constants
+except ImportError:  # Python < 3.11
+    import sre_parse
+    import sre_constants
+
+# Runs of spaces and tabs within a line
+_BLANKS = re.compile(r"[^\S\n]+")
+
+# Highest character checked in character class ranges for upper-case letters
+_CLASS_LIMIT = 0x24F
+
+_REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT, getattr(sre_constants, "POSSESSIVE_REPEAT", None))
+
+
+# Case-fold text and collapse runs of spaces and tabs into one space. Line breaks are
+# kept, so ".*" in a rule still stays within one line of a message.
+def fold(text):
+    return _BLANKS.sub(" ", text.casefold())
+
+
+# Canonicalizes a message once before the category rules run on it: fold() it, then
+# replace the shorthand and misspellings in tokens (canonical form -> list of variants)
+# with their canonical form, as whole words. Rules are written against the canonical
+# text, so they need neither IGNORECASE nor every spelling of a word.
+class Normalizer:
+    def __init__(self, tokens):
+        self.tokens = {}
+        for canonical, variants in tokens.items():
+            for variant in variants:
+                self.tokens[fold(variant)] = fold(canonical)
+        self._regex = None
+        if self.tokens:
+            # Longest first, so "tm force" wins over a shorter variant it starts with
+            alternatives = sorted(self.tokens, key=len, reverse=True)
+            self._regex = re.compile(r"\b(?:" + "|".join(map(re.escape, alternatives)) + r")\b")
+
+    def __call__(self, text):
+        text = fold(text)
+        if self._regex is None:
+            return text
+        return self._regex.sub(self._replace, text)
+
+    def _replace(self, match):
+        return self.tokens[match.group(0)]
+
+
+# Return the problems of the "normalize" table of a rules file (canonical form -> list
+# of variants), as a list of messages
+def check_tokens(tokens):
+    if not isinstance(tokens, dict):
+        return ["normalize must be an object of canonical forms and their variants"]
+    errors = []
+    seen = {}
+    for canonical, variants in tokens.items():
+        where = f"normalize {canonical!r}"
+        if not canonical.strip():
+            errors.append(f"{where}: canonical form must be a non-empty string")
+        if not isinstance(variants, list) or not variants:
+            errors.append(f"{where}: variants must be a non-empty list")
+            continue
+        for variant in variants:
+            if not isinstance(variant, str) or not re.fullmatch(r"\w(.*\w)?", variant, re.DOTALL):
+                errors.append(f"{where}: variant {variant!r} must start and end with a letter or digit")
+            elif fold(variant) in seen:
+                errors.append(f"{where}: variant {variant!r} is already listed under {seen[fold(variant)]!r}")
+            elif fold(variant) in tokens:
+                errors.append(f"{where}: variant {variant!r} is itself a canonical form")
+            else:
+                seen[fold(variant)] = canonical
+    return errors
+
+
+# The upper-case characters a pattern needs that case-folded text never has, as a
+# string ("" for none): upper-case literals, and classes with upper-case letters
+# whose lower-case ones they leave out, like [A-a]
+def upper_case_only(pattern):
+    found = set()
+    _upper_case_only(sre_parse.parse(pattern), found)
+    return "".join(sorted(found))
+
+
+def _upper_case_only(items, found):
+    for op, av in items:
+        if op in (sre_constants.LITERAL, sre_constants.NOT_LITERAL):
+            if chr(av) != chr(av).casefold():
+                found.add(chr(av))
+        elif op is sre_constants.IN:
+            chars = set()
+            for item_op, item_av in av:
+                if item_op is sre_constants.LITERAL:
+                    chars.add(chr(item_av))
+                elif item_op is sre_constants.RANGE:
+                    chars.update(chr(code) for code in range(item_av[0], min(item_av[1], _CLASS_LIMIT) + 1))
+            found.update(char for char in chars if char != char.casefold() and char.casefold() not in chars)
+        elif op in _REPEATS:
+            _upper_case_only(av[2], found)
+        elif op is sre_constants.SUBPATTERN:
+            _upper_case_only(av[-1], found)
+        elif op is sre_constants.BRANCH:
+            for branch in av[1]:
+                _upper_case_only(branch, found)
+        elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            _upper_case_only(av[1], found)
+        elif op is getattr(sre_constants, "ATOMIC_GROUP", None):
+            _upper_case_only(av, found)
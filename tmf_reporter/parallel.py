@@ -0,0 +1,168 @@
+import atexit
+import multiprocessing
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+
+from tmf_reporter.engine import ENGINE
+
+# Messages sent to a worker at a time
+SHARD_SIZE = 256
+
+# Processes in the shared pool. Its size never changes; the workers argument of the
+# functions below only bounds how many tasks one run keeps in flight.
+POOL_WORKERS = os.cpu_count() or 1
+
+# Engines other than ENGINE a worker keeps loaded, least recently used dropped first
+WORKER_ENGINES = 4
+
+_pool = None
+_pool_lock = threading.Lock()
+
+# In this process: engine key -> file the engine is pickled to, for the workers
+_engine_dir = None
+_engine_files = {}
+
+# In a worker: engine key -> engine
+_worker_engines = OrderedDict()
+
+
+# A picklable handle on engine for a task in the shared pool: None for ENGINE, which
+# every worker has, or (key, path) for another one. Such an engine is pickled to a file
+# once per rule set and engine class, and each worker loads it from there the first time
+# a task names it, so tasks stay small and the pool is not tied to one engine.
+def engine_ref(engine):
+    global _engine_dir
+    if engine is ENGINE:
+        return None
+    key = (type(engine).__name__, engine.version)
+    with _pool_lock:
+        path = _engine_files.get(key)
+        if path is None:
+            if _engine_dir is None:
+                _engine_dir = tempfile.mkdtemp(prefix="tmf-engines-")
+            path = os.path.join(_engine_dir, f"{key[0]}-{key[1]}.pickle")
+            with open(path + ".tmp", "wb") as file:
+                pickle.dump(engine, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(path + ".tmp", path)
+            _engine_files[key] = path
+    return key, path
+
+
+# The engine named by ref (see engine_ref), for tasks run in the shared pool
+def worker_engine(ref=None):
+    if ref is None:
+        return ENGINE
+    key, path = ref
+    engine = _worker_engines.get(key)
+    if engine is None:
+        with open(path, "rb") as file:
+            engine = pickle.load(file)
+        _worker_engines[key] = engine
+        if len(_worker_engines) > WORKER_ENGINES:
+            _worker_engines.popitem(last=False)
+    else:
+        _worker_engines.move_to_end(key)
+    return engine
+
+
+# Classify the texts of one shard in a worker, as (rule index, tickets, IDs) each.
+# The Message records stay in the parent; only their text travels to the worker.
+def _classify_shard(ref, texts):
+    return worker_engine(ref).classify_texts(texts)
+
+
+# Return the shared process pool of POOL_WORKERS processes, shared by all runs and
+# engines. It is only replaced when a worker died and broke it. Workers are spawned
+# rather than forked so it is safe to start from Streamlit's threads.
+def get_executor():
+    global _pool
+    with _pool_lock:
+        if _pool is None or getattr(_pool, "_broken", False):
+            _pool = ProcessPoolExecutor(max_workers=POOL_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+@atexit.register
+def shutdown_executor():
+    global _pool, _engine_dir
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+        if _engine_dir is not None:
+            shutil.rmtree(_engine_dir, ignore_errors=True)
+            _engine_dir = None
+            _engine_files.clear()
+
+
+def _shards(messages, size):
+    shard = []
+    for message in messages:
+        shard.append(message)
+        if len(shard) >= size:
+            yield shard
+            shard = []
+    if shard:
+        yield shard
+
+
+# Map fn over (item, argument) pairs in the pool, yielding (item, fn(ref, argument)) in
+# order, with a bounded number of shards in flight
+def _ordered_map(executor, fn, ref, items, window):
+    pending = deque()
+    try:
+        for item, argument in items:
+            pending.append((item, executor.submit(fn, ref, argument)))
+            if len(pending) >= window:
+                item, future = pending.popleft()
+                yield item, future.result()
+        while pending:
+            item, future = pending.popleft()
+            yield item, future.result()
+    finally:
+        # Stopped early (an error, or a cancelled job closing the rows): the shards not
+        # started yet are dropped instead of left to run for nobody
+        for _, future in pending:
+            future.cancel()
+
+
+# Yield (message, rule index, tickets, IDs) rows for Message records like
+# RuleEngine.classify_all, spreading the regex work over a pool of worker processes.
+# Shards come back in their original order. workers (None for all of the pool) bounds
+# the shards in flight to twice as many.
+def classify_parallel(messages, engine=ENGINE, workers=None, shard_size=SHARD_SIZE):
+    workers = min(workers or POOL_WORKERS, POOL_WORKERS)
+    executor = get_executor()
+    window = 2 * workers
+    shards = ((shard, [message.text for message in shard]) for shard in _shards(messages, shard_size))
+    for shard, classifications in _ordered_map(executor, _classify_shard, engine_ref(engine), shards, window):
+        for message, (index, tickets, ids) in zip(shard, classifications):
+            message.tickets, message.ids = tickets, ids
+            yield message, index, tickets, ids
+
+
+# Classify sequentially, or in the process pool when more than one worker is asked for.
+# With guard (a guard.GuardedMatcher for engine), classify under its time budget instead.
+def classify(messages, engine=ENGINE, workers=1, guard=None):
+    if guard is not None:
+        return guard.classify_all(messages)
+    if workers is not None and workers <= 1:
+        return engine.classify_all(messages)
+    return classify_parallel(messages, engine=engine, workers=workers)
+
+
+# Categorize Message records into result like RuleEngine.categorize. The rows are
+# merged in this process in their original order, so the result (including which
+# category first claims a ticket or ID) is exactly the sequential one.
+def categorize_parallel(messages, result, engine=ENGINE, workers=None, shard_size=SHARD_SIZE):
+    return engine.merge(classify_parallel(messages, engine, workers, shard_size), result)
+
+
+# Categorize sequentially, or in the process pool when more than one worker is asked for
+def categorize(messages, result, engine=ENGINE, workers=1, guard=None):
+    return engine.merge(classify(messages, engine, workers, guard), result)
@@ -0,0 +1,231 @@
+import codecs
+import io
+import re
+
+try:
+    import re._parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+# Timestamp header at the start of a line, used to find where a message starts when cleansing
+TIMESTAMP_PATTERN = r'\[\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2} (?:am|pm)\]|\[\d{1,2}:\d{2} (?:am|pm), \d{1,2}/\d{1,2}/\d{4}\]|\[\d{1,2}:\d{2}, \d{1,2}/\d{1,2}/\d{4}\]|^\[\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2} [APM]{2}]'
+
+# Timestamp headers that separate message blocks when categorizing. The last
+# alternative (upper-case AM/PM) only counts at the very start of the text.
+HEADER_PATTERN = r'\[\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2} (?:am|pm)\]|\[\d{1,2}:\d{2} (?:am|pm), \d{1,2}/\d{1,2}/\d{4}\]|\[\d{1,2}:\d{2}, \d{1,2}/\d{1,2}/\d{4}\]'
+MESSAGE_SPLIT_PATTERN = HEADER_PATTERN + r'|^\[\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2} [APM]{2}]'
+
+timestamp_regex = re.compile(TIMESTAMP_PATTERN)
+header_regex = re.compile(HEADER_PATTERN)
+message_split_regex = re.compile(MESSAGE_SPLIT_PATTERN)
+
+# Longest text a header can span, so a chunk boundary never cuts one unseen
+MAX_HEADER_LENGTH = sre_parse.parse(MESSAGE_SPLIT_PATTERN).getwidth()[1]
+
+CHUNK_SIZE = 1 << 16
+
+# Bytes looked at to guess the encoding of an export without a byte order mark
+SNIFF_SIZE = 1 << 12
+
+# Byte order marks, longest first (the UTF-32 LE mark starts like the UTF-16 LE one)
+BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# Guess the encoding of an export from its first bytes: a byte order mark, the zero
+# bytes of UTF-16 without one, UTF-8 if they decode as such, or else Windows-1252
+def sniff_encoding(head):
+    head = bytes(head[:SNIFF_SIZE])
+    for bom, encoding in BOMS:
+        if head.startswith(bom):
+            return encoding
+    half = len(head) // 2
+    if half:
+        even_zeros = head[0::2].count(0)
+        odd_zeros = head[1::2].count(0)
+        # Mostly ASCII text in UTF-16 has a zero in every other byte
+        if odd_zeros > half * 0.4 and even_zeros < half * 0.1:
+            return "utf-16-le"
+        if even_zeros > half * 0.4 and odd_zeros < half * 0.1:
+            return "utf-16-be"
+    try:
+        # Not final: the sample may end in the middle of a character
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "cp1252"
+
+
+def _peek(source):
+    if getattr(source, "seekable", None) and source.seekable():
+        head = source.read(SNIFF_SIZE)
+        source.seek(0)
+        return head
+    if hasattr(source, "peek"):
+        return source.peek(SNIFF_SIZE)
+    return b""
+
+
+# Open a string, a text stream, bytes or a binary upload/file as a text stream.
+# Binary input is decoded incrementally, in the encoding sniffed from its first bytes
+# unless one is given; bytes that do not decode become U+FFFD instead of stopping the
+# run. Line endings are kept as is.
+def open_text(source, encoding=None):
+    if isinstance(source, str):
+        return io.StringIO(source, newline="")
+    if isinstance(source, io.TextIOBase):
+        return source
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+    # Uploads are re-read on every Streamlit rerun, so always start from the top
+    if getattr(source, "seekable", None) and source.seekable():
+        source.seek(0)
+    if encoding is None:
+        encoding = sniff_encoding(_peek(source))
+    return io.TextIOWrapper(source, encoding=encoding, errors="replace", newline="")
+
+
+# Give the underlying binary file back to its owner instead of closing it
+def _release(text, source):
+    if text is not source and isinstance(text, io.TextIOWrapper):
+        text.detach()
+
+
+# Yield the lines of the input one at a time, exactly as str.splitlines()
+# would return them for the whole decoded text
+def iter_lines(source):
+    text = open_text(source)
+    try:
+        for line in text:
+            # Reading with newline="" splits on \n, \r and \r\n only; splitlines
+            # also breaks on the other Unicode line boundaries
+            yield from line.splitlines()
+    finally:
+        _release(text, source)
+
+
+# Yield (header, block) pairs for the message blocks between timestamp headers
+# one at a time, while only holding one chunk and the current message in memory.
+# The blocks are exactly what re.split(MESSAGE_SPLIT_PATTERN, text) returns and
+# header is the timestamp that preceded each one ("" for the first).
+def iter_message_records(source, chunk_size=CHUNK_SIZE):
+    text = open_text(source)
+    try:
+        buffer = ""
+        header = ""
+        pending = []
+        at_start = True
+
+        while True:
+            chunk = text.read(chunk_size)
+            eof = not chunk
+            buffer += chunk
+
+            if at_start:
+                if len(buffer) < MAX_HEADER_LENGTH and not eof:
+                    continue
+                at_start = False
+                match = message_split_regex.match(buffer)
+                if match:
+                    yield header, ""
+                    header = match.group()
+                    buffer = buffer[match.end():]
+
+            # Headers starting after limit could still change with more text
+            limit = len(buffer) if eof else len(buffer) - MAX_HEADER_LENGTH
+            pos = 0
+            while True:
+                match = header_regex.search(buffer, pos)
+                if match is None or match.start() > limit:
+                    break
+                pending.append(buffer[pos:match.start()])
+                yield header, "".join(pending)
+                header = match.group()
+                pending = []
+                pos = match.end()
+
+            if eof:
+                pending.append(buffer[pos:])
+                yield header, "".join(pending)
+                return
+
+            if limit >= pos:
+                pending.append(buffer[pos:limit + 1])
+                buffer = buffer[limit + 1:]
+            else:
+                buffer = buffer[pos:]
+    finally:
+        _release(text, source)
+
+
+# Count the message blocks iter_message_records would yield, without building them
+def count_messages(source, chunk_size=CHUNK_SIZE):
+    text = open_text(source)
+    try:
+        count = 1
+        buffer = ""
+        at_start = True
+
+        while True:
+            chunk = text.read(chunk_size)
+            eof = not chunk
+            buffer += chunk
+
+            if at_start:
+                if len(buffer) < MAX_HEADER_LENGTH and not eof:
+                    continue
+                at_start = False
+                match = message_split_regex.match(buffer)
+                if match:
+                    count += 1
+                    buffer = buffer[match.end():]
+
+            limit = len(buffer) if eof else len(buffer) - MAX_HEADER_LENGTH
+            pos = 0
+            for match in header_regex.finditer(buffer):
+                if match.start() > limit:
+                    break
+                count += 1
+                pos = match.end()
+
+            if eof:
+                return count
+            buffer = buffer[max(pos, limit + 1):]
+    finally:
+        _release(text, source)
+
+
+# Yield the message blocks between timestamp headers one at a time, exactly
+# as re.split(MESSAGE_SPLIT_PATTERN, text) would return them
+def iter_messages(source, chunk_size=CHUNK_SIZE):
+    for _, block in iter_message_records(source, chunk_size):
+        yield block
+
+
+# Yield (header, block) pairs from text that arrives as a sequence of pieces,
+# such as cleansed messages and their separators. Same result as splitting the
+# joined text, provided no header spans two pieces and the text does not start
+# with an upper-case AM/PM header.
+def split_piece_records(pieces):
+    header = ""
+    pending = []
+    for piece in pieces:
+        pos = 0
+        for match in header_regex.finditer(piece):
+            pending.append(piece[pos:match.start()])
+            yield header, "".join(pending)
+            header = match.group()
+            pending = []
+            pos = match.end()
+        pending.append(piece[pos:])
+    yield header, "".join(pending)
+
+
+# Yield the message blocks of text that arrives as a sequence of pieces
+def split_pieces(pieces):
+    for _, block in split_piece_records(pieces):
+        yield block
@@ -0,0 +1,48 @@
+from tmf_reporter.cleansing import iter_filtered_messages
+from tmf_reporter.engine import ENGINE
+from tmf_reporter.message import parse_pieces
+from tmf_reporter.parallel import categorize
+
+
+# Heading of each export's part in the cleansed text
+def cleansed_banner(name):
+    return f"===Cleansed content from {name}:===\n"
+
+
+# Function to yield the cleansed text of several exports piece by piece, laid out
+# exactly like the "Download cleansed text" file of the cleansing step. tick, if given,
+# is called for every message read from the exports, kept or not.
+def iter_cleansed_pieces(sources, base_names, match_anywhere=False, tick=None):
+    for i, (name, source) in enumerate(sources):
+        if i:
+            yield "\n\n"
+        yield cleansed_banner(name)
+        for j, message in enumerate(iter_filtered_messages(source, base_names, match_anywhere, tick)):
+            if j:
+                yield "\n\n"
+            yield message
+
+
+# Function to cleanse and categorize exports in a single pass.
+# sources is a list of (file name, string or file object) pairs. Each message is
+# parsed once, dropped if sent by one of base_names, lowercased and categorized
+# straight away; the result is the same as categorizing the cleansed download.
+# When cleansed_output is a writable text stream, the cleansed text is written to it.
+# workers > 1 (or None for all CPU cores) categorizes in the shared process pool, and
+# guard (a guard.GuardedMatcher) categorizes under its time budget.
+def cleanse_and_categorize(sources, base_names, cleansed_output=None, engine=ENGINE, workers=1, match_anywhere=False,
+                           guard=None):
+    pieces = iter_cleansed_pieces(sources, base_names, match_anywhere)
+    if cleansed_output is not None:
+        pieces = tee(pieces, cleansed_output)
+
+    result = engine.new_result()
+    categorize(parse_pieces(pieces), result, engine=engine, workers=workers, guard=guard)
+    return result
+
+
+# Function to pass pieces of text through while also writing them to output
+def tee(pieces, output):
+    for piece in pieces:
+        output.write(piece)
+        yield piece
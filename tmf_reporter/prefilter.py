@@ -0,0 +1,143 @@
+try:
+    import re._parser as sre_parse
+    import re._constants as sre_constants
+except ImportError:  # Python < 3.11
+    import sre_parse
+    import sre_constants
+
+from collections import deque
+
+LITERAL = sre_constants.LITERAL
+AT = sre_constants.AT
+BRANCH = sre_constants.BRANCH
+SUBPATTERN = sre_constants.SUBPATTERN
+REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT)
+
+
+# Collect what every match of a parsed sequence must contain, as a list of
+# factors. Each factor is a set of literals of which at least one occurs.
+# Zero-width \b/^ anchors keep a literal run going; optional parts end it.
+def _required_factors(items, factors, current):
+    for op, av in items:
+        if op is LITERAL:
+            current.append(chr(av))
+        elif op is AT:
+            continue
+        elif op is SUBPATTERN:
+            _required_factors(av[-1], factors, current)
+        else:
+            if current:
+                factors.append(frozenset(["".join(current)]))
+                current.clear()
+            if op is BRANCH:
+                alternatives = _any_of(av[1])
+                if alternatives:
+                    factors.append(alternatives)
+            elif op in REPEATS and av[0] >= 1:
+                _best_factor_of(av[2], factors)
+    return factors
+
+
+# Append the required factors of a sub-sequence that is matched at least once
+def _best_factor_of(items, factors):
+    current = []
+    _required_factors(items, factors, current)
+    if current:
+        factors.append(frozenset(["".join(current)]))
+
+
+# Pick the most selective factor: longest shortest-literal, then fewest literals
+def _best(factors):
+    factors = [f for f in factors if all(literal.isascii() for literal in f)]
+    if not factors:
+        return None
+    return max(factors, key=lambda f: (min(map(len, f)), -len(f)))
+
+
+# Literals of which one must occur for an alternation to match, or None
+def _any_of(alternatives):
+    literals = set()
+    for alternative in alternatives:
+        factors = []
+        _best_factor_of(alternative, factors)
+        best = _best(factors)
+        if best is None:
+            return None
+        literals.update(best)
+    return frozenset(literals)
+
+
+# Return the set of literals of which at least one occurs in any text the
+# pattern matches, lowercased for case-insensitive rules. Returns None when no
+# such literal exists, i.e. the rule has to run on every message. Only ASCII
+# literals are kept, so callers should skip the check for non-ASCII text.
+def extract_literals(pattern, ignorecase=True):
+    try:
+        parsed = sre_parse.parse(pattern)
+    except (sre_constants.error, RecursionError):
+        return None
+
+    factors = []
+    _best_factor_of(parsed, factors)
+    best = _best(factors)
+    if best is None:
+        return None
+    return frozenset(literal.lower() for literal in best) if ignorecase else best
+
+
+# Aho-Corasick automaton that reports which keys have a literal occurring in a
+# text, in a single pass. Keys are given as a bitmask so callers can test
+# membership of many rules at once.
+class LiteralMatcher:
+    def __init__(self, literals_by_key):
+        goto = [{}]
+        output = [0]
+
+        for key, literals in enumerate(literals_by_key):
+            for literal in literals or ():
+                state = 0
+                for ch in literal:
+                    nxt = goto[state].get(ch)
+                    if nxt is None:
+                        nxt = len(goto)
+                        goto[state][ch] = nxt
+                        goto.append({})
+                        output.append(0)
+                    state = nxt
+                output[state] |= 1 << key
+
+        # Breadth-first pass to build failure links and merge outputs
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                output[nxt] |= output[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._output = output
+
+    # Return a bitmask of the keys whose literals occur in text
+    def scan(self, text):
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        found = 0
+        for ch in text:
+            while True:
+                nxt = goto[state].get(ch)
+                if nxt is not None:
+                    state = nxt
+                    break
+                if not state:
+                    break
+                state = fail[state]
+            found |= output[state]
+        return found
@@ -0,0 +1,234 @@
+import cProfile
+import io
+import marshal
+import pstats
+import time
+from contextlib import contextmanager
+
+from tmf_reporter.engine import RuleEngine
+from tmf_reporter.parser import open_text
+
+# Stages of a run, in pipeline order
+DECODE = "decode"
+NAME_FILTER = "name filter"
+SPLIT = "read & split"
+TICKETS = "tickets/IDs"
+NORMALIZE = "normalize"
+PREFILTER = "prefilter"
+RULES = "category rules"
+MERGE = "merge & de-duplicate"
+FORMAT = "format report"
+STAGES = (DECODE, NAME_FILTER, SPLIT, TICKETS, NORMALIZE, PREFILTER, RULES, MERGE, FORMAT)
+
+_END = object()
+
+
+# Timings of one opt-in profiled run: wall time and calls per stage, and per category
+# rule its evaluations, hits and total and longest match time, plus how many messages
+# no rule matched and how many of those went to "Others" (had tickets/IDs). Stage times
+# are exclusive: a stage running inside another (decoding while splitting, the rules
+# while merging) is only counted in the inner one. engine is the RuleEngine to time,
+# used through self.engine; with cprofile, the run is also captured by cProfile.
+class RunProfile:
+    def __init__(self, engine, cprofile=False):
+        count = len(engine.rules)
+        self.rule_names = [rule.name for rule in engine.rules]
+        self.rules_version = engine.version
+        self.evals = [0] * count
+        self.hits = [0] * count
+        self.seconds = [0.0] * count
+        self.longest = [0.0] * count
+        self.stages = {}
+        self.messages = 0
+        self.unmatched = 0
+        self.others = 0
+        self.wall_seconds = 0.0
+        self.engine = ProfiledEngine(engine, self)
+        self.profiler = cProfile.Profile() if cprofile else None
+        self.cprofile_stats = None
+        # Time spent in inner stages, one entry per stage being timed
+        self._inner = []
+
+    # Start timing a stage; pass what it returns to stop()
+    def start(self):
+        self._inner.append(0.0)
+        return time.perf_counter()
+
+    def stop(self, stage, start):
+        elapsed = time.perf_counter() - start
+        inner = self._inner.pop()
+        totals = self.stages.setdefault(stage, [0, 0.0])
+        totals[0] += 1
+        totals[1] += elapsed - inner
+        if self._inner:
+            self._inner[-1] += elapsed
+
+    # Yield the items of an iterator, timing each step of it as the stage
+    def timed(self, stage, items):
+        items = iter(items)
+        while True:
+            start = self.start()
+            try:
+                item = next(items, _END)
+            finally:
+                self.stop(stage, start)
+            if item is _END:
+                return
+            yield item
+
+    # Call fn(*args), timed as the stage
+    def call(self, stage, fn, *args):
+        start = self.start()
+        try:
+            return fn(*args)
+        finally:
+            self.stop(stage, start)
+
+    # Open a string, upload or binary file as a text stream whose reads are timed as decoding
+    def text(self, source):
+        return TimedText(open_text(source), self)
+
+    def stage_rows(self):
+        return [
+            {"Stage": stage, "Calls": self.stages[stage][0], "Seconds": round(self.stages[stage][1], 4)}
+            for stage in STAGES if stage in self.stages
+        ]
+
+    # Rules that were evaluated, slowest first
+    def rule_rows(self):
+        rows = [
+            {"Rule": name, "Evaluations": self.evals[i], "Hits": self.hits[i], "Seconds": round(self.seconds[i], 4),
+             "Longest (ms)": round(self.longest[i] * 1000, 3)}
+            for i, name in enumerate(self.rule_names) if self.evals[i]
+        ]
+        rows.sort(key=lambda row: row["Seconds"], reverse=True)
+        return rows
+
+    # Everything measured, as a JSON-ready dict
+    def report(self):
+        return {
+            "rules_version": self.rules_version,
+            "wall_seconds": self.wall_seconds,
+            "messages": self.messages,
+            "unmatched": self.unmatched,
+            "others": self.others,
+            "stages": self.stage_rows(),
+            "rules": self.rule_rows(),
+        }
+
+    # The cProfile capture as text, the top functions by cumulative time
+    def cprofile_text(self, limit=40):
+        if self.cprofile_stats is None:
+            return ""
+        output = io.StringIO()
+        pstats.Stats(self.profiler, stream=output).sort_stats("cumulative").print_stats(limit)
+        return output.getvalue()
+
+    # The cProfile capture in the .prof format read by pstats and snakeviz
+    def cprofile_bytes(self):
+        return marshal.dumps(self.cprofile_stats.stats) if self.cprofile_stats is not None else b""
+
+
+# Context manager timing a run with profile (a RunProfile) and capturing it with cProfile
+# if asked to. Does nothing when profile is None.
+@contextmanager
+def profiling(profile):
+    if profile is None:
+        yield None
+        return
+    start = time.perf_counter()
+    if profile.profiler is not None:
+        profile.profiler.enable()
+    try:
+        yield profile
+    finally:
+        if profile.profiler is not None:
+            profile.profiler.disable()
+            profile.cprofile_stats = pstats.Stats(profile.profiler)
+        profile.wall_seconds += time.perf_counter() - start
+
+
+# A RuleEngine that records the work of its matching in a RunProfile. Classification and
+# merging are RuleEngine's own code, run with the timed ticket/ID scan, prefilter and
+# rule loop below; everything else comes from the wrapped engine.
+class ProfiledEngine:
+    def __init__(self, engine, profile):
+        self._engine = engine
+        self._profile = profile
+
+    def __getattr__(self, name):
+        return getattr(self._engine, name)
+
+    classify_text = RuleEngine.classify_text
+    classify = RuleEngine.classify
+    classify_all = RuleEngine.classify_all
+    categorize = RuleEngine.categorize
+
+    def find_tokens(self, text):
+        return self._profile.call(TICKETS, self._engine.find_tokens, text)
+
+    # RuleEngine.match_index, timing each regex it runs
+    def match_index(self, message):
+        profile = self._profile
+        clock = time.perf_counter
+        rules = self._engine.rules
+        if self._engine.normalizer is not None:
+            message = profile.call(NORMALIZE, self._engine.normalizer, message)
+        candidates = profile.call(PREFILTER, self._engine.candidates, message)
+        start = profile.start()
+        try:
+            while candidates:
+                lowest = candidates & -candidates
+                index = lowest.bit_length() - 1
+                began = clock()
+                matched = rules[index].regex.search(message)
+                elapsed = clock() - began
+                profile.evals[index] += 1
+                profile.seconds[index] += elapsed
+                if elapsed > profile.longest[index]:
+                    profile.longest[index] = elapsed
+                if matched:
+                    profile.hits[index] += 1
+                    return index
+                candidates ^= lowest
+            return -1
+        finally:
+            profile.stop(RULES, start)
+
+    def merge(self, classified, result):
+        return self._profile.call(MERGE, RuleEngine.merge, self, self._counted(classified), result)
+
+    # Pass the classified rows through, counting them and those left to "Others"; making
+    # them (parsing messages, unless that happened before) is timed as splitting
+    def _counted(self, classified):
+        profile = self._profile
+        for row in profile.timed(SPLIT, classified):
+            _, index, tickets, ids = row
+            profile.messages += 1
+            if index == -1:
+                profile.unmatched += 1
+                if tickets or ids:
+                    profile.others += 1
+            yield row
+
+
+# A text stream whose reads are timed as decoding. Closing it (or letting it go) gives
+# the underlying file back to its owner, like parser._release does.
+class TimedText(io.TextIOBase):
+    def __init__(self, text, profile):
+        self._text = text
+        self._profile = profile
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        return self._profile.call(DECODE, self._text.read, size)
+
+    def readline(self, size=-1):
+        return self._profile.call(DECODE, self._text.readline, size)
+
+    def close(self):
+        if not self.closed and isinstance(self._text, io.TextIOWrapper):
+            self._text.detach()
+        super().close()
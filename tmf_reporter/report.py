@@ -0,0 +1,75 @@
+import io
+
+import numpy as np
+import pandas as pd
+
+try:
+    import openpyxl
+except ImportError:  # Optional, only needed for the Excel download
+    openpyxl = None
+
+from tmf_reporter.rules import MESSAGE_CATEGORIES
+
+# Columns of the CSV and Excel downloads
+REPORT_COLUMNS = ("Category", "Ticket/ID", "Message")
+
+# True when openpyxl is installed and the report can be downloaded as an Excel workbook
+XLSX_AVAILABLE = openpyxl is not None
+
+
+# Function to format categorized results (a results.ResultTable) as the plain-text report.
+# "Others" and quarantine entries are printed with their message. Each distinct value is
+# upper-cased once, and each category's lines are built from its slice of the table.
+def format_result(result):
+    upper = [value.upper() for value in result.values]
+    messages = result.messages
+    output = []
+    for issue, values, message_ids in result.by_category():
+        output.append(f"{issue}:")
+        if issue in MESSAGE_CATEGORIES:
+            output.extend(
+                f"{upper[value]} - Message: {messages[message]}"
+                for value, message in zip(values.tolist(), message_ids.tolist())
+            )
+        else:
+            output.extend([upper[value] for value in values.tolist()])
+        output.append("")  # Blank line after each issue
+    return "\n".join(output)
+
+
+# Rows of one category of the results as (ticket/ID, message text), the message text
+# being "" outside "Others" and the quarantine. start and stop select a page of them.
+def category_rows(result, issue, start=0, stop=None):
+    return [
+        (value.upper(), "" if message is None else str(message))
+        for value, message in result.entries(issue, start, stop)
+    ]
+
+
+# The results as a DataFrame with the REPORT_COLUMNS, in report order, built by
+# indexing the table's distinct values and messages with its columns
+def result_frame(result):
+    category, value, message = result.ordered_columns()
+    values = np.array([value.upper() for value in result.values] + [""], dtype=object)
+    # The extra "" at the end is what message index -1 picks
+    messages = np.array([str(message) for message in result.messages] + [""], dtype=object)
+    return pd.DataFrame({
+        REPORT_COLUMNS[0]: pd.Categorical.from_codes(category, categories=result.categories),
+        REPORT_COLUMNS[1]: values[value],
+        REPORT_COLUMNS[2]: messages[message],
+    })
+
+
+# The CSV report as bytes, with a byte order mark so Excel reads it as UTF-8
+def csv_bytes(result):
+    return result_frame(result).to_csv(index=False).encode("utf-8-sig")
+
+
+# The report as an Excel workbook with one sheet and a row per ticket/ID. Needs
+# openpyxl (pip install openpyxl).
+def xlsx_bytes(result):
+    if openpyxl is None:
+        raise RuntimeError("Excel downloads need openpyxl: pip install openpyxl")
+    output = io.BytesIO()
+    result_frame(result).to_excel(output, sheet_name="Report", index=False, engine="openpyxl")
+    return output.getvalue()
@@ -0,0 +1,251 @@
+from array import array
+from collections import namedtuple
+
+import numpy as np
+
+from tmf_reporter.rules import QUARANTINE_CATEGORY
+
+# Kind of a value in the results
+TICKET = 0
+ID = 1
+
+# Array type codes of the columns and their numpy dtypes
+_INDEX = "i"
+_KIND = "b"
+_DTYPES = {_INDEX: np.intc, _KIND: np.int8}
+
+# Columns that index a table of distinct strings, and the name of that table
+_STRING_COLUMNS = {
+    "category": "categories",
+    "value": "values",
+    "time": "times",
+    "sender": "senders",
+    "file_name": "file_names",
+}
+
+# One row of the results with its strings filled in. message is the Message record or
+# text kept for "Others" and the quarantine, or None; time, sender and file_name are
+# where the hit came from ("" when unknown).
+ResultRow = namedtuple("ResultRow", ["category", "value", "kind", "message", "time", "sender", "file_name"])
+
+
+def _column(values, typecode=_INDEX):
+    return np.frombuffer(values, dtype=_DTYPES[typecode]).copy() if len(values) else np.zeros(0, _DTYPES[typecode])
+
+
+# Replace the part of an array column from start on
+def _replace(column, start, values):
+    del column[start:]
+    column.frombytes(values.astype(_DTYPES[column.typecode]).tobytes())
+
+
+# (time, sender, file name) of a message; messages kept as text only have none
+def message_origin(message):
+    return getattr(message, "time", ""), getattr(message, "sender", ""), getattr(message, "file_name", "")
+
+
+# Rows collected by RuleEngine.merge before they go into a ResultTable, as plain lists:
+# for each row its category index, value text, kind, message (index into messages, or
+# -1) and origin (index into origins, the (time, sender, file name) of each message
+# that has rows, in order)
+class NewRows:
+    def __init__(self):
+        self.category = []
+        self.value = []
+        self.kind = []
+        self.message = []
+        self.origin = []
+        self.messages = []
+        self.origins = []
+        self._position = None
+
+    def add_message(self, message):
+        self.messages.append(message)
+        return len(self.messages) - 1
+
+    # Add a row per value, from the message at position in the classified rows
+    def add(self, position, message, category, values, kind, kept=-1):
+        if position != self._position:
+            self._position = position
+            self.origins.append(message_origin(message))
+        count = len(values)
+        self.category += [category] * count
+        self.value += values
+        self.kind += [kind] * count
+        self.message += [kept] * count
+        self.origin += [len(self.origins) - 1] * count
+
+
+# Categorized results as one table with a row per ticket/ID hit, in the order they were
+# found. Each row holds its category (index into categories, kept in report order), its
+# value (index into values, which holds each distinct ticket/ID text once), its kind
+# (TICKET or ID), its message (index into messages, or -1: only "Others" and the
+# quarantine keep the message, a Message record or its text) and the time, sender and
+# file name of the message it came from (indexes into times, senders and file_names).
+# The columns are typed arrays, so counts, de-duplication and exports run over them as
+# numpy arrays.
+class ResultTable:
+    def __init__(self, categories=()):
+        self.messages = []
+        self.kind = array(_KIND)
+        self.message = array(_INDEX)
+        self._ids = {}
+        for column, strings in _STRING_COLUMNS.items():
+            setattr(self, column, array(_INDEX))
+            setattr(self, strings, [])
+            self._ids[strings] = {}
+        # Rows from a message whose time, sender or file is not known point at ""
+        for strings in ("times", "senders", "file_names"):
+            self._intern(strings, "")
+        for name in categories:
+            self.category_id(name)
+
+    def __len__(self):
+        return len(self.category)
+
+    def _columns(self):
+        return [getattr(self, column) for column in _STRING_COLUMNS] + [self.kind, self.message]
+
+    # Index of text in one of the string tables, added at the end if it is new
+    def _intern(self, strings, text):
+        ids = self._ids[strings]
+        index = ids.get(text)
+        if index is None:
+            table = getattr(self, strings)
+            index = ids[text] = len(table)
+            table.append(text)
+        return index
+
+    # Index of a category, added after the others if it is new
+    def category_id(self, name):
+        return self._intern("categories", name)
+
+    def value_id(self, value):
+        return self._intern("values", value)
+
+    # Append one row by category name and value text, as read back from a stored report
+    def append(self, category, value, kind=TICKET, message=None, time="", sender="", file_name=""):
+        self.category.append(self.category_id(category))
+        self.value.append(self.value_id(value))
+        self.kind.append(kind)
+        self.message.append(-1)
+        if message is not None:
+            self.messages.append(message)
+            self.message[-1] = len(self.messages) - 1
+        self.time.append(self._intern("times", time))
+        self.sender.append(self._intern("senders", sender))
+        self.file_name.append(self._intern("file_names", file_name))
+
+    # Add NewRows, then drop the ones whose value already came up in an earlier message
+    # of them, keeping the rows of the first message that has it. Tickets and IDs are
+    # told apart, and quarantine rows are checked only against each other. Messages whose
+    # rows were all dropped are not kept.
+    def add_new_rows(self, rows):
+        if not rows.origin:
+            return
+        value_id = self.value_id
+        category = np.array(rows.category, dtype=np.intc)
+        value = np.array([value_id(value) for value in rows.value], dtype=np.int64)
+        kind = np.array(rows.kind, dtype=np.int8)
+        message = np.array(rows.message, dtype=np.intc)
+        origin = np.array(rows.origin, dtype=np.intc)
+
+        quarantine = category == self._ids["categories"].get(QUARANTINE_CATEGORY, -1)
+        keys = np.where(quarantine, -1 - value, value * 2 + kind)
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        keep = origin == origin[first][inverse.reshape(-1)]
+
+        message = message[keep]
+        if rows.messages:
+            used = np.unique(message[message >= 0])
+            renumber = np.full(len(rows.messages), -1, dtype=np.intc)
+            renumber[used] = np.arange(len(self.messages), len(self.messages) + len(used), dtype=np.intc)
+            self.messages.extend([rows.messages[i] for i in used.tolist()])
+            message = np.where(message >= 0, renumber[message], -1)
+
+        origin = origin[keep]
+        start = len(self)
+        _replace(self.category, start, category[keep])
+        _replace(self.value, start, value[keep])
+        _replace(self.kind, start, kind[keep])
+        _replace(self.message, start, message)
+        for column, strings, part in (("time", "times", 0), ("sender", "senders", 1), ("file_name", "file_names", 2)):
+            ids = np.array([self._intern(strings, parts[part]) for parts in rows.origins], dtype=np.intc)
+            _replace(getattr(self, column), start, ids[origin])
+
+    # Keep only the rows for which keep (a boolean array over all rows) is true
+    def _keep(self, keep):
+        for column in self._columns():
+            _replace(column, 0, _column(column, column.typecode)[keep])
+
+    # Drop every row whose value is one of values
+    def drop_values(self, values):
+        ids = [self._ids["values"][value] for value in values if value in self._ids["values"]]
+        if ids and len(self):
+            self._keep(~np.isin(_column(self.value), ids))
+
+    # The distinct values that have rows
+    def row_values(self):
+        return [self.values[value] for value in np.unique(_column(self.value)).tolist()]
+
+    # Append the rows of another table, after the rows already here
+    def extend(self, other):
+        for column, strings in _STRING_COLUMNS.items():
+            ids = np.array([self._intern(strings, text) for text in getattr(other, strings)], dtype=np.intc)
+            if len(other):
+                _replace(getattr(self, column), len(self), ids[_column(getattr(other, column))])
+        if not len(other):
+            return
+        message = _column(other.message)
+        _replace(self.message, len(self.message), np.where(message >= 0, message + len(self.messages), -1))
+        self.messages.extend(other.messages)
+        _replace(self.kind, len(self.kind), _column(other.kind, _KIND))
+
+    # Number of rows per category name, in report order
+    def counts(self):
+        counts = np.bincount(_column(self.category), minlength=len(self.categories))
+        return dict(zip(self.categories, counts.tolist()))
+
+    # Row positions in report order: by category, then in the order they were found
+    def report_order(self):
+        return np.argsort(_column(self.category), kind="stable")
+
+    # The category, value and message columns as numpy arrays, in report order
+    def ordered_columns(self):
+        order = self.report_order()
+        return _column(self.category)[order], _column(self.value)[order], _column(self.message)[order]
+
+    # Yield (category name, value ids, message ids) for each category with rows, in report order
+    def by_category(self):
+        category, value, message = self.ordered_columns()
+        ends = np.cumsum(np.bincount(category, minlength=len(self.categories)))
+        start = 0
+        for name, end in zip(self.categories, ends.tolist()):
+            if end > start:
+                yield name, value[start:end], message[start:end]
+            start = end
+
+    # The (value, message or None) entries of one category, in the order they were
+    # found; start and stop select a page of them
+    def entries(self, category, start=0, stop=None):
+        if category not in self._ids["categories"]:
+            return []
+        rows = np.flatnonzero(_column(self.category) == self._ids["categories"][category])[start:stop]
+        return [
+            (self.values[value], self.messages[message] if message >= 0 else None)
+            for value, message in zip(_column(self.value)[rows].tolist(), _column(self.message)[rows].tolist())
+        ]
+
+    # Yield a ResultRow for every row, in report order
+    def rows(self):
+        for row in self.report_order().tolist():
+            message = self.message[row]
+            yield ResultRow(
+                self.categories[self.category[row]],
+                self.values[self.value[row]],
+                self.kind[row],
+                self.messages[message] if message >= 0 else None,
+                self.times[self.time[row]],
+                self.senders[self.sender[row]],
+                self.file_names[self.file_name[row]],
+            )
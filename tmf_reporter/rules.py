@@ -0,0 +1,195 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import namedtuple
+
+from tmf_reporter.normalize import check_tokens, upper_case_only
+
+# The category rules live in a rules file (rules.json next to this module, or the file
+# named by TMF_REPORTER_RULES): the ticket/order and ID patterns, then the categories
+# in report order, each with its pattern and what it captures. Patterns are checked in
+# order and the first match wins. With a "normalize" table, the patterns run on the
+# case-folded message with shorthand replaced by canonical forms (see normalize.py).
+# Bump "revision" when editing the rules.
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rules.json")
+
+# Layout of the rules file understood by this code
+RULES_FORMAT = 1
+
+# What a category captures from a matching message
+CAPTURE_MODES = ("both", "tickets", "ids")
+
+# Fallback category for messages with tickets/IDs but no matching issue. Maybe due to
+# invalid order/ ticket number/ duplicate issues/ standalone ticket/ order numbers/ issue
+# mmg xletak, cuma minta bantuan ja - basically masuk 'others', due to NO CONTEXT!
+OTHERS_CATEGORY = "Others (to manually add into report)"
+
+# Messages that went over the time budget of guarded matching, kept with their tickets/IDs
+QUARANTINE_CATEGORY = "Quarantined (timed out)"
+
+# Categories whose entries are (ticket/ID, message) pairs rather than tickets/IDs
+MESSAGE_CATEGORIES = (OTHERS_CATEGORY, QUARANTINE_CATEGORY)
+
+_TOP_KEYS = {"format", "revision", "ignore_case", "normalize", "ticket_order_pattern", "id_pattern", "categories"}
+_CATEGORY_KEYS = {"name", "capture", "pattern"}
+
+
+# A rules file that cannot be used; the message lists every problem found
+class RulesError(ValueError):
+    pass
+
+
+# A loaded and validated rules file. digest is a short hash of the file's bytes;
+# normalize is the table of canonical forms and their variants, or None when the
+# patterns run on the message as it is.
+RuleSet = namedtuple("RuleSet", [
+    "issue_patterns", "ticket_order_pattern", "id_pattern", "ids_only", "tickets_only", "flags",
+    "revision", "digest", "path", "normalize",
+])
+
+
+# Path of the rules file the app and the command-line tools use
+def rules_path():
+    return os.environ.get("TMF_REPORTER_RULES") or DEFAULT_RULES_PATH
+
+
+def _check_pattern(pattern, flags, where, errors):
+    if not isinstance(pattern, str) or not pattern:
+        errors.append(f"{where}: pattern must be a non-empty string")
+        return
+    try:
+        re.compile(pattern, flags)
+    except re.error as error:
+        errors.append(f"{where}: invalid pattern: {error}")
+
+
+# Validate the contents of a rules file and return its RuleSet. Raises RulesError.
+def parse_rules(data, path="<rules>"):
+    try:
+        document = json.loads(data)
+    except ValueError as error:
+        raise RulesError(f"{path}: not a valid JSON file: {error}")
+    if not isinstance(document, dict):
+        raise RulesError(f"{path}: expected a JSON object at the top level")
+    if document.get("format") != RULES_FORMAT:
+        raise RulesError(f"{path}: unsupported format {document.get('format')!r}, expected {RULES_FORMAT}")
+
+    errors = [f"unknown key {key!r}" for key in sorted(set(document) - _TOP_KEYS)]
+    ignore_case = document.get("ignore_case", True)
+    if not isinstance(ignore_case, bool):
+        errors.append("ignore_case must be true or false")
+    flags = re.IGNORECASE if ignore_case else 0
+    normalize = document.get("normalize")
+    if normalize is not None:
+        errors.extend(check_tokens(normalize))
+    # Tickets and IDs are searched case-sensitively, like before the rules file
+    for key in ("ticket_order_pattern", "id_pattern"):
+        _check_pattern(document.get(key), 0, key, errors)
+
+    categories = document.get("categories")
+    if not isinstance(categories, list) or not categories:
+        errors.append("categories must be a non-empty list")
+        categories = []
+
+    issue_patterns = {}
+    ids_only = set()
+    tickets_only = set()
+    for i, category in enumerate(categories, 1):
+        if not isinstance(category, dict):
+            errors.append(f"category #{i}: expected an object")
+            continue
+        name = category.get("name")
+        where = f"category #{i} ({name!r})"
+        errors.extend(f"{where}: unknown key {key!r}" for key in sorted(set(category) - _CATEGORY_KEYS))
+        if not isinstance(name, str) or not name.strip():
+            errors.append(f"{where}: name must be a non-empty string")
+            continue
+        if name in issue_patterns or name in MESSAGE_CATEGORIES:
+            errors.append(f"{where}: duplicate category name")
+            continue
+        capture = category.get("capture", "both")
+        if capture not in CAPTURE_MODES:
+            errors.append(f"{where}: capture must be one of {', '.join(CAPTURE_MODES)}")
+        elif capture == "ids":
+            ids_only.add(name)
+        elif capture == "tickets":
+            tickets_only.add(name)
+        _check_pattern(category.get("pattern"), flags, where, errors)
+        # Normalized text is case-folded, so without ignore_case these never match
+        if normalize is not None and not flags and isinstance(category.get("pattern"), str):
+            try:
+                upper = upper_case_only(category["pattern"])
+            except re.error:
+                upper = ""
+            if upper:
+                errors.append(f"{where}: pattern needs upper-case {upper!r}, which normalized text does not have")
+        issue_patterns[name] = category.get("pattern")
+
+    if errors:
+        raise RulesError(f"{path}: " + "; ".join(errors))
+
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return RuleSet(
+        issue_patterns,
+        document["ticket_order_pattern"],
+        document["id_pattern"],
+        frozenset(ids_only),
+        frozenset(tickets_only),
+        flags,
+        document.get("revision"),
+        hashlib.sha256(data).hexdigest()[:16],
+        path,
+        {canonical: tuple(variants) for canonical, variants in normalize.items()} if normalize is not None else None,
+    )
+
+
+# Load and validate a rules file. Raises RulesError, or OSError when it cannot be read.
+def load_rules(path=None):
+    path = path or rules_path()
+    with open(path, "rb") as file:
+        return parse_rules(file.read(), path)
+
+
+# Keeps the RuleSet of a rules file current for a long-running server. The file is only
+# read again when its modification time or size changes. A broken edit keeps the last
+# good rules in use and is reported in error until the file is fixed.
+class RulesWatcher:
+    def __init__(self, path=None):
+        self.path = path or rules_path()
+        self.error = None
+        self._rules = None
+        self._stat = None
+        self._lock = threading.Lock()
+
+    # Return the current RuleSet, reloading the file if it changed
+    def current(self):
+        with self._lock:
+            try:
+                stat = os.stat(self.path)
+                key = (stat.st_mtime_ns, stat.st_size)
+            except OSError as error:
+                key = None
+                self.error = f"{self.path}: {error.strerror}"
+            if key is not None and key != self._stat:
+                self._stat = key
+                try:
+                    self._rules = load_rules(self.path)
+                    self.error = None
+                except (OSError, RulesError) as error:
+                    self.error = str(error)
+            if self._rules is None:
+                raise RulesError(self.error)
+            return self._rules
+
+
+# The rules in use when the package is imported
+RULES = load_rules()
+
+ISSUE_PATTERNS = RULES.issue_patterns
+TICKET_ORDER_PATTERN = RULES.ticket_order_pattern
+ID_PATTERN = RULES.id_pattern
+IDS_ONLY_CATEGORIES = RULES.ids_only
+TICKETS_ONLY_CATEGORIES = RULES.tickets_only
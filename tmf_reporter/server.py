@@ -0,0 +1,253 @@
+import argparse
+import json
+import sys
+import threading
+import time
+import traceback
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from tmf_reporter.cleansing import DEFAULT_BASE_NAMES, filter_messages, get_name_filter, split_base_names
+from tmf_reporter.engine import ENGINE, engine_from_rules
+from tmf_reporter.message import Message
+from tmf_reporter.parallel import POOL_WORKERS, SHARD_SIZE, classify, engine_ref, get_executor, shutdown_executor
+from tmf_reporter.parser import open_text
+from tmf_reporter.rules import OTHERS_CATEGORY, RULES, RulesError, RulesWatcher
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Largest request body accepted, in bytes
+MAX_BODY = 32 << 20
+
+# Batches with at least this many messages are spread over the worker pool
+PARALLEL_MIN = 2 * SHARD_SIZE
+
+
+# Request counts and timings of one endpoint
+class EndpointStats:
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.messages = 0
+        self.seconds = 0.0
+        self.longest = 0.0
+
+    def as_dict(self):
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "messages": self.messages,
+            "mean_ms": round(self.seconds / self.requests * 1000, 3) if self.requests else 0.0,
+            "longest_ms": round(self.longest * 1000, 3),
+        }
+
+
+# The categorization and cleansing kept warm for the HTTP handlers, shared by all
+# request threads. The rules file is watched like in the app: an edit is compiled on the
+# next request, and a broken edit keeps the previous rules. Batches of PARALLEL_MIN
+# messages or more go to the shared process pool when workers is not 1; smaller ones,
+# like single messages from a bot, are classified in the request's thread.
+class CategorizerService:
+    def __init__(self, workers=1, base_names=None, watcher=None):
+        self.workers = workers
+        self.base_names = split_base_names(DEFAULT_BASE_NAMES) if base_names is None else base_names
+        self.watcher = watcher or RulesWatcher()
+        self.started = time.time()
+        self.stats = {}
+        self._engine = ENGINE
+        self._digest = RULES.digest
+        self._lock = threading.Lock()
+
+    # The engine for the current rules file, compiled once per change of it
+    def engine(self):
+        try:
+            rules = self.watcher.current()
+        except RulesError:
+            return self._engine
+        with self._lock:
+            if rules.digest != self._digest:
+                self._engine = ENGINE if rules.digest == RULES.digest else engine_from_rules(rules)
+                self._digest = rules.digest
+            return self._engine
+
+    # Compile the rules, fill the name filter cache and start the worker pool before the first request
+    def warm_up(self):
+        engine = self.engine()
+        engine.classify_text("warm up q000000 1-000000000")
+        get_name_filter(tuple(self.base_names), False)
+        if self.workers != 1:
+            get_executor()
+            engine_ref(engine)
+
+    # Categorize message texts: a dict per text with its category (None when no rule
+    # matched and it has no tickets/IDs), tickets and IDs
+    def categorize(self, texts):
+        engine = self.engine()
+        messages = [Message(text) for text in texts]
+        workers = self.workers if len(messages) >= PARALLEL_MIN else 1
+        results = []
+        for _, index, tickets, ids in classify(messages, engine, workers):
+            if index >= 0:
+                category = engine.rules[index].name
+            else:
+                category = OTHERS_CATEGORY if tickets or ids else None
+            results.append({"category": category, "tickets": list(tickets), "ids": list(ids)})
+        return results
+
+    # Cleanse an export (text or bytes in any export encoding) like Process 1
+    def cleanse(self, export, base_names=None, match_anywhere=False):
+        return filter_messages(open_text(export), self.base_names if base_names is None else base_names,
+                               match_anywhere)
+
+    def record(self, endpoint, seconds, messages=0, error=False):
+        with self._lock:
+            stats = self.stats.setdefault(endpoint, EndpointStats())
+            stats.requests += 1
+            stats.errors += error
+            stats.messages += messages
+            stats.seconds += seconds
+            stats.longest = max(stats.longest, seconds)
+
+    # Status and metrics, as a JSON-ready dict
+    def health(self):
+        engine = self.engine()
+        memo_hits, memo_lookups = engine.memo.stats() if engine.memo is not None else (0, 0)
+        with self._lock:
+            endpoints = {endpoint: stats.as_dict() for endpoint, stats in sorted(self.stats.items())}
+        return {
+            "status": "ok" if self.watcher.error is None else "degraded",
+            "uptime_seconds": round(time.time() - self.started, 1),
+            "rules_version": engine.version,
+            "rules_error": self.watcher.error,
+            "workers": min(self.workers or POOL_WORKERS, POOL_WORKERS),
+            "memo_hit_rate": round(memo_hits / memo_lookups, 4) if memo_lookups else None,
+            "endpoints": endpoints,
+        }
+
+
+# A request the service turns down, sent back as {"error": message} with status
+class RequestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# The texts to categorize from a request body: a JSON array of strings or an object with
+# a "messages" array, or else the whole plain-text body as one message
+def request_texts(body, content_type):
+    if content_type.split(";")[0].strip() != "application/json":
+        return [open_text(body).read()]
+    try:
+        document = json.loads(body)
+    except ValueError as error:
+        raise RequestError(400, f"invalid JSON: {error}")
+    texts = document.get("messages") if isinstance(document, dict) else document
+    if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+        raise RequestError(400, 'expected a JSON array of strings or {"messages": [...]}')
+    return texts
+
+
+class Handler(BaseHTTPRequestHandler):
+    server_version = "TMFReporter"
+    # Set on a subclass by make_server()
+    service = None
+    quiet = False
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == "/health":
+            self._send(200, self.service.health())
+        else:
+            self._send(404, {"error": f"no such endpoint: {path}"})
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path not in ("/categorize", "/cleanse"):
+            self._send(404, {"error": f"no such endpoint: {url.path}"})
+            return
+        start = time.perf_counter()
+        count = 0
+        try:
+            body = self._body()
+            if url.path == "/categorize":
+                texts = request_texts(body, self.headers.get("Content-Type", ""))
+                count = len(texts)
+                payload = {"rules_version": self.service.engine().version, "results": self.service.categorize(texts)}
+            else:
+                query = parse_qs(url.query)
+                names = split_base_names(query["names"][0]) if "names" in query else None
+                anywhere = query.get("anywhere", ["0"])[0].lower() in ("1", "true", "yes")
+                payload = {"text": self.service.cleanse(body, names, anywhere)}
+        except RequestError as error:
+            self.service.record(url.path, time.perf_counter() - start, count, error=True)
+            self._send(error.status, {"error": str(error)})
+            return
+        # A bug or a broken engine fails the request, not the connection, and shows in the stats
+        except Exception as error:
+            self.service.record(url.path, time.perf_counter() - start, count, error=True)
+            self.log_error("%s failed: %s", url.path, traceback.format_exc())
+            self._send(500, {"error": f"internal error: {type(error).__name__}: {error}"})
+            return
+        self.service.record(url.path, time.perf_counter() - start, count)
+        self._send(200, payload)
+
+    def _body(self):
+        try:
+            length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            raise RequestError(411, "Content-Length is required")
+        if length > MAX_BODY:
+            raise RequestError(413, f"request body over {MAX_BODY >> 20} MB")
+        return self.rfile.read(length)
+
+    def _send(self, status, payload):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+
+# Build the HTTP server for a CategorizerService, warmed up and ready to serve_forever()
+def make_server(service, host=DEFAULT_HOST, port=DEFAULT_PORT, quiet=False):
+    handler = type("ServiceHandler", (Handler,), {"service": service, "quiet": quiet})
+    service.warm_up()
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m tmf_reporter.server",
+        description="Serve categorization and cleansing over HTTP on this machine, with the rules kept compiled.",
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"address to listen on (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"port to listen on (default: {DEFAULT_PORT})")
+    parser.add_argument("-j", "--workers", type=int, default=1,
+                        help=f"worker processes for batches of {PARALLEL_MIN}+ messages, 0 for all cores (default: 1)")
+    parser.add_argument("--names", default=DEFAULT_BASE_NAMES, help="comma-separated names /cleanse removes by default")
+    parser.add_argument("--quiet", action="store_true", help="do not log each request")
+    args = parser.parse_args(argv)
+
+    service = CategorizerService(args.workers or None, split_base_names(args.names))
+    server = make_server(service, args.host, args.port, args.quiet)
+    print(f"Serving on http://{args.host}:{server.server_address[1]} (rules {service.engine().version})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        shutdown_executor()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+import argparse
+import datetime
+import json
+import os
+import random
+import re
+import sys
+
+try:
+    import re._parser as sre_parse
+    import re._constants as sre_constants
+except ImportError:  # Python < 3.11
+    import sre_parse
+    import sre_constants
+
+from tmf_reporter.cleansing import DEFAULT_BASE_NAMES, split_base_names
+from tmf_reporter.rules import ISSUE_PATTERNS, TICKET_ORDER_PATTERN, ID_PATTERN
+
+# Bumped whenever the generated text changes, so cached exports are regenerated
+GENERATOR_VERSION = 1
+
+MB = 1 << 20
+
+# Reporters asking for help, next to the base_names senders (the team's own replies)
+REPORTERS = [
+    "Ali Bakar", "Siti Aminah", "Ahmad TM", "Kumar", "~ Joe", "Farah UNIFI", "Mat Zain", "+60 12-345 6789",
+    "Azlan Team Ru", "Lim Ah Kow", "Nur Aisyah", "Rajesh", "Kak Ton", "Zul Installer",
+]
+
+# Malay/English shorthand of the chat around the requests
+CHATTER = (
+    "mohon bantuan tq sila semak order ini untuk team kami terima kasih boleh tolong check status nova tmf "
+    "ra ru ui ok noted dah buat tlg bantu sy nk x boleh cust dh tunggu lama urgent pls asap bos tuan puan "
+    "dlm kat tu ni je ye ya dah settle done fyi update skrg esok pagi petang site installer"
+).split()
+
+REPLIES = ["ok noted", "dah settle", "done tq", "on it", "sila cuba semula", "ok boss", "noted, tunggu kejap", "dah release"]
+
+# Shares of messages: asking about a categorized issue, a ticket/ID with no context, plain chatter
+ISSUE_SHARE = 0.6
+BARE_TOKEN_SHARE = 0.15
+
+WORD_CHARS = "abcdefghijklmnopqrstuvwxyz"
+
+# How often each format_header style is used. Upper-case AM/PM headers (style 3) only
+# split messages at the start of a file when categorizing, so their runs become one block.
+HEADER_STYLE_WEIGHTS = (0.4, 0.3, 0.25, 0.05)
+
+
+def _pick_in(items, rnd):
+    negate = items and items[0][0] is sre_constants.NEGATE
+    choices = []
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            choices.append(chr(av))
+        elif op is sre_constants.RANGE:
+            choices.append(chr(rnd.randint(av[0], av[1])))
+        elif op is sre_constants.CATEGORY:
+            choices.append(_pick_category(av, rnd))
+    if negate or not choices:
+        return rnd.choice(WORD_CHARS)
+    return rnd.choice(choices)
+
+
+def _pick_category(category, rnd):
+    name = str(category)
+    if "NOT" in name:
+        return "#"
+    if "DIGIT" in name:
+        return rnd.choice("0123456789")
+    if "SPACE" in name:
+        return " "
+    return rnd.choice(WORD_CHARS)
+
+
+def _sample(items, rnd, out):
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            out.append(chr(av))
+        elif op is sre_constants.NOT_LITERAL:
+            out.append("x" if chr(av) != "x" else "y")
+        elif op is sre_constants.ANY:
+            out.append(rnd.choice(WORD_CHARS + "  "))
+        elif op is sre_constants.IN:
+            out.append(_pick_in(av, rnd))
+        elif op is sre_constants.CATEGORY:
+            out.append(_pick_category(av, rnd))
+        elif op is sre_constants.BRANCH:
+            _sample(rnd.choice(av[1]), rnd, out)
+        elif op is sre_constants.SUBPATTERN:
+            _sample(av[-1], rnd, out)
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            low, high, body = av
+            for _ in range(rnd.randint(low, min(high, low + 2))):
+                _sample(body, rnd, out)
+        # Anchors, lookarounds and backreferences add no text
+
+
+# Return a random string shaped like a match of pattern (not always an exact match:
+# lookarounds and word boundaries are ignored)
+def sample_pattern(parsed, rnd):
+    out = []
+    _sample(parsed, rnd, out)
+    return " ".join("".join(out).split())
+
+
+# Timestamp header in one of the four formats the parser recognizes
+def format_header(when, style):
+    hour12 = when.hour % 12 or 12
+    meridiem = "am" if when.hour < 12 else "pm"
+    date = f"{when.day}/{when.month}/{when.year}"
+    if style == 0:
+        return f"[{date} {hour12}:{when.minute:02d} {meridiem}]"
+    if style == 1:
+        return f"[{hour12}:{when.minute:02d} {meridiem}, {date}]"
+    if style == 2:
+        return f"[{when.hour:02d}:{when.minute:02d}, {date}]"
+    return f"[{date} {hour12}:{when.minute:02d} {meridiem.upper()}]"
+
+
+# Builds random chat messages: requests from reporters, phrased like the category
+# rules, with ticket/order numbers and IDs, and replies from the base_names senders
+class ExportGenerator:
+    def __init__(self, seed=0, base_names=None, issue_patterns=ISSUE_PATTERNS, start=datetime.datetime(2024, 1, 1, 8, 0)):
+        self.rnd = random.Random(seed)
+        names = split_base_names(DEFAULT_BASE_NAMES) if base_names is None else base_names
+        self.team = [name for name in names if re.match(r'\w+', name)]
+        self.issues = [sre_parse.parse(pattern) for pattern in issue_patterns.values()]
+        self.tickets = sre_parse.parse(TICKET_ORDER_PATTERN)
+        self.ids = sre_parse.parse(ID_PATTERN)
+        self.when = start
+        self.style = 0
+
+    def _token(self):
+        rnd = self.rnd
+        return sample_pattern(self.tickets if rnd.random() < 0.7 else self.ids, rnd)
+
+    def _request(self):
+        rnd = self.rnd
+        words = [rnd.choice(CHATTER) for _ in range(rnd.randint(1, 6))]
+        roll = rnd.random()
+        if roll < ISSUE_SHARE:
+            words.insert(rnd.randint(0, len(words)), sample_pattern(rnd.choice(self.issues), rnd))
+        for _ in range(rnd.choice((0, 1, 1, 1, 2, 3)) if roll < ISSUE_SHARE + BARE_TOKEN_SHARE else 0):
+            words.insert(rnd.randint(0, len(words)), self._token())
+        text = " ".join(words)
+        if rnd.random() < 0.2:
+            text = text.upper() if rnd.random() < 0.3 else text.title()
+        if rnd.random() < 0.15:
+            middle = len(text) // 2
+            text = text[:middle] + "\n" + text[middle:]
+        return text
+
+    # Return the next message as a line of the export
+    def message(self):
+        rnd = self.rnd
+        self.when += datetime.timedelta(minutes=rnd.choice((0, 0, 1, 1, 2, 5, 17)))
+        # Exports keep one header format for long stretches
+        if rnd.random() < 0.01:
+            self.style = rnd.choices(range(4), HEADER_STYLE_WEIGHTS)[0]
+        header = format_header(self.when, self.style)
+        if self.team and rnd.random() < 0.3:
+            return f"{header} {rnd.choice(self.team)}: {rnd.choice(REPLIES)}"
+        return f"{header} {rnd.choice(REPORTERS)}: {self._request()}"
+
+
+# Write a synthetic export of at least size bytes to path. Returns the number of messages.
+def generate_export(path, size, seed=0, base_names=None):
+    generator = ExportGenerator(seed, base_names)
+    messages = 0
+    written = 0
+    with open(path, "w", encoding="utf-8", newline="\n") as file:
+        lines = []
+        while written < size:
+            line = generator.message() + "\n"
+            lines.append(line)
+            written += len(line.encode("utf-8"))
+            messages += 1
+            if len(lines) >= 1000:
+                file.write("".join(lines))
+                lines = []
+        file.write("".join(lines))
+    return messages
+
+
+# Return (path, manifest) of a cached synthetic export of size_mb megabytes in folder,
+# generating it first if needed. The manifest records its seed, size and message count.
+def cached_export(folder, size_mb, seed=0):
+    os.makedirs(folder, exist_ok=True)
+    stem = f"export-{size_mb:g}mb-seed{seed}-v{GENERATOR_VERSION}"
+    path = os.path.join(folder, stem + ".txt")
+    manifest_path = os.path.join(folder, stem + ".json")
+    if os.path.exists(path) and os.path.exists(manifest_path):
+        with open(manifest_path, encoding="utf-8") as file:
+            return path, json.load(file)
+    messages = generate_export(path, int(size_mb * MB), seed)
+    manifest = {"seed": seed, "size_mb": size_mb, "bytes": os.path.getsize(path), "messages": messages,
+                "generator_version": GENERATOR_VERSION}
+    with open(manifest_path, "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=2)
+    return path, manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m tmf_reporter.synthetic",
+        description="Write a synthetic WhatsApp-style TMF export for testing and benchmarks.",
+    )
+    parser.add_argument("output", help="text file to write")
+    parser.add_argument("--size", type=float, default=1.0, help="size in MB (default: 1)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default: 0)")
+    args = parser.parse_args(argv)
+
+    messages = generate_export(args.output, int(args.size * MB), args.seed)
+    print(f"Wrote {messages} messages to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
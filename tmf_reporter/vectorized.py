@@ -0,0 +1,248 @@
+import re
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # Optional, rules then run message by message over each batch
+    pa = None
+
+try:
+    import re._parser as sre_parse
+    import re._constants as sre_constants
+except ImportError:  # Python < 3.11
+    import sre_parse
+    import sre_constants
+
+from tmf_reporter.engine import RuleEngine, engine_from_rules
+from tmf_reporter.rules import RULES
+
+# Messages classified together
+BATCH_SIZE = 4096
+
+# True when pyarrow is installed and rules can run over a whole batch at once
+VECTORIZED_AVAILABLE = pa is not None
+
+# Longest counted repeat RE2 accepts
+_RE2_MAX_REPEAT = 1000
+
+# What \d, \w and \s match in ASCII text, spelled out: RE2's own \s leaves out \v and
+# the \x1c-\x1f separators that Python's \s matches
+_CATEGORIES = {
+    sre_constants.CATEGORY_DIGIT: (r"0-9", False),
+    sre_constants.CATEGORY_NOT_DIGIT: (r"0-9", True),
+    sre_constants.CATEGORY_WORD: (r"0-9A-Za-z_", False),
+    sre_constants.CATEGORY_NOT_WORD: (r"0-9A-Za-z_", True),
+    sre_constants.CATEGORY_SPACE: (r"\t\n\x0b\x0c\r\x1c-\x1f ", False),
+    sre_constants.CATEGORY_NOT_SPACE: (r"\t\n\x0b\x0c\r\x1c-\x1f ", True),
+}
+_ANCHORS = {
+    sre_constants.AT_BEGINNING: "^",
+    sre_constants.AT_BEGINNING_STRING: r"\A",
+    sre_constants.AT_END_STRING: r"\z",
+    sre_constants.AT_BOUNDARY: r"\b",
+    sre_constants.AT_NON_BOUNDARY: r"\B",
+}
+
+
+# Classes matching no character and any character
+_NOTHING = r"[^\x00-\x{10ffff}]"
+_ANYTHING = r"[\x00-\x{10ffff}]"
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def _char(code):
+    if code > 127:
+        raise _Unsupported()
+    char = chr(code)
+    return char if char.isalnum() else f"\\x{code:02x}"
+
+
+# The ASCII characters a non-ASCII literal matches, like k for the Kelvin sign when
+# ignoring case, as the inside of a class ("" for none)
+def _ascii_equivalents(code, flags):
+    literal = re.compile(re.escape(chr(code)), flags & re.IGNORECASE)
+    return "".join(_char(ascii_code) for ascii_code in range(128) if literal.fullmatch(chr(ascii_code)))
+
+
+def _class(items, flags):
+    negate = False
+    parts = []
+    for op, av in items:
+        if op is sre_constants.NEGATE:
+            negate = True
+        elif op is sre_constants.LITERAL:
+            parts.append(_char(av) if av < 128 else _ascii_equivalents(av, flags))
+        elif op is sre_constants.RANGE:
+            parts.append(f"{_char(av[0])}-{_char(av[1])}")
+        elif op is sre_constants.CATEGORY and av in _CATEGORIES:
+            chars, negated = _CATEGORIES[av]
+            # A negated category can only be flipped when it is the whole class
+            if negated and len(items) - negate != 1:
+                raise _Unsupported()
+            negate ^= negated
+            parts.append(chars)
+        else:
+            raise _Unsupported()
+    if not "".join(parts):
+        return _ANYTHING if negate else _NOTHING
+    return f"[{'^' if negate else ''}{''.join(parts)}]"
+
+
+def _repeat(op, av, flags, relaxed):
+    low, high, items = av
+    if low > _RE2_MAX_REPEAT or (high != sre_constants.MAXREPEAT and high > _RE2_MAX_REPEAT):
+        raise _Unsupported()
+    count = f"{{{low},}}" if high == sre_constants.MAXREPEAT else f"{{{low},{high}}}"
+    return f"(?:{_sequence(items, flags, relaxed)}){count}{'?' if op is sre_constants.MIN_REPEAT else ''}"
+
+
+# RE2 text for a parsed sequence. Zero-width assertions RE2 does not have (lookarounds
+# and $, which Python also lets match before a final newline) and possessive repeats are
+# relaxed: left out, or made plain repeats. Text matched by the pattern still matches
+# the relaxed one, so it can screen texts for the pattern; relaxed[0] records it.
+def _sequence(items, flags, relaxed):
+    out = []
+    for op, av in items:
+        if op is sre_constants.LITERAL and av < 128:
+            out.append(_char(av))
+        elif op in (sre_constants.LITERAL, sre_constants.NOT_LITERAL):
+            negate = [(sre_constants.NEGATE, None)] if op is sre_constants.NOT_LITERAL else []
+            out.append(_class(negate + [(sre_constants.LITERAL, av)], flags))
+        elif op is sre_constants.ANY:
+            out.append(".")
+        elif op is sre_constants.IN:
+            out.append(_class(av, flags))
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            out.append(_repeat(op, av, flags, relaxed))
+        elif op is getattr(sre_constants, "POSSESSIVE_REPEAT", None):
+            relaxed[0] = True
+            out.append(_repeat(sre_constants.MAX_REPEAT, av, flags, relaxed))
+        elif op is getattr(sre_constants, "ATOMIC_GROUP", None):
+            relaxed[0] = True
+            out.append(f"(?:{_sequence(av, flags, relaxed)})")
+        elif op is sre_constants.SUBPATTERN:
+            if av[1] or av[2]:  # Inline flags for part of the pattern
+                raise _Unsupported()
+            out.append(f"(?:{_sequence(av[3], flags, relaxed)})")
+        elif op is sre_constants.BRANCH:
+            out.append(f"(?:{'|'.join(_sequence(branch, flags, relaxed) for branch in av[1])})")
+        elif op is sre_constants.AT and av in _ANCHORS:
+            out.append(_ANCHORS[av])
+        elif (op is sre_constants.AT and av is sre_constants.AT_END) or op in (sre_constants.ASSERT,
+                                                                              sre_constants.ASSERT_NOT):
+            relaxed[0] = True
+        else:
+            raise _Unsupported()
+    return "".join(out)
+
+
+# Translate a pattern into RE2 syntax for pyarrow, meaning the same on ASCII text.
+# Returns (RE2 pattern, exact), exact being False when the RE2 pattern was relaxed
+# (see _sequence) and only screens texts for the real pattern; or None when the
+# pattern uses something RE2 has no equivalent for, like back-references.
+def re2_screen(pattern, flags=0):
+    if flags & (re.MULTILINE | re.DOTALL | re.VERBOSE | re.LOCALE | re.ASCII):
+        return None
+    relaxed = [False]
+    try:
+        screen = _sequence(sre_parse.parse(pattern, flags), flags, relaxed)
+    except (_Unsupported, sre_constants.error, RecursionError):
+        return None
+    if pa is not None:
+        # Compile it once, so patterns RE2 turns down (e.g. too large) are found here
+        try:
+            pc.match_substring_regex(pa.array([""]), screen, ignore_case=bool(flags & re.IGNORECASE))
+        except pa.ArrowException:
+            return None
+    return screen, not relaxed[0]
+
+
+# A RuleEngine that classifies messages a batch at a time. Each category rule runs once
+# over the batch, on the messages no earlier rule matched, so the first matching rule
+# still decides. Over ASCII text a rule runs as its RE2 translation in pyarrow, outside
+# the interpreter; where that was relaxed, the real pattern then confirms the messages
+# it picked. Non-ASCII text, and rules RE2 cannot express, go through the prefilter and
+# Python's regex message by message. Tickets and IDs are found as before. The results
+# are the same as RuleEngine's.
+class VectorizedEngine(RuleEngine):
+    def __init__(self, *args, batch_size=BATCH_SIZE, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.batch_size = batch_size
+        self.screens = [
+            re2_screen(rule.regex.pattern, rule.regex.flags) if pa is not None else None for rule in self.rules
+        ]
+
+    # Return the index of the first matching rule (or -1) for each text, as a numpy array
+    def match_indexes(self, texts):
+        rules = self.rules
+        if self.normalizer is not None:
+            texts = [self.normalizer(text) for text in texts]
+        indexes = np.full(len(texts), -1, dtype=np.intp)
+        remaining = np.arange(len(texts))
+        ascii_rows = np.fromiter((text.isascii() for text in texts), dtype=bool, count=len(texts))
+        strings = pa.array(texts, pa.large_string()) if pa is not None and ascii_rows.any() else None
+        candidates = None
+
+        for index, (rule, screen) in enumerate(zip(rules, self.screens)):
+            if not len(remaining):
+                break
+            slow = remaining
+            matched = []
+            if screen is not None and strings is not None:
+                fast = remaining[ascii_rows[remaining]]
+                slow = remaining[~ascii_rows[remaining]]
+                if len(fast):
+                    found = pc.match_substring_regex(strings.take(fast), screen[0], ignore_case=self._ignorecase)
+                    picked = fast[found.to_numpy(zero_copy_only=False)]
+                    matched = picked.tolist() if screen[1] else [
+                        row for row in picked.tolist() if rule.regex.search(texts[row])
+                    ]
+            if len(slow):
+                if candidates is None:
+                    candidates = [0] * len(texts)
+                    for row in remaining.tolist():
+                        candidates[row] = self.candidates(texts[row])
+                bit = 1 << index
+                matched += [row for row in slow.tolist() if candidates[row] & bit and rule.regex.search(texts[row])]
+            if matched:
+                indexes[matched] = index
+                remaining = remaining[indexes[remaining] < 0]
+        return indexes
+
+    # Classify texts as (index of the matching rule or -1, tickets, IDs) each
+    def classify_texts(self, texts):
+        tokens = [self.find_tokens(text) for text in texts]
+        return [
+            (index, tickets, ids) for index, (tickets, ids) in zip(self.match_indexes(texts).tolist(), tokens)
+        ]
+
+    # Yield (message, rule index, tickets, IDs) for each Message record, a batch at a time
+    def classify_all(self, messages):
+        batch = []
+        for message in messages:
+            batch.append(message)
+            if len(batch) >= self.batch_size:
+                yield from self._classify_batch(batch)
+                batch = []
+        if batch:
+            yield from self._classify_batch(batch)
+
+    def _classify_batch(self, messages):
+        for message in messages:
+            if message.tickets is None:
+                message.tickets, message.ids = self.find_tokens(message.text)
+        indexes = self.match_indexes([message.text for message in messages])
+        for message, index in zip(messages, indexes.tolist()):
+            yield message, index, message.tickets, message.ids
+
+
+# The VectorizedEngine for the rules file, built on first use in each process
+@lru_cache(maxsize=1)
+def default_engine():
+    return engine_from_rules(RULES, engine_class=VectorizedEngine)